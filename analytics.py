@@ -8,13 +8,15 @@ Designed for both programmatic use and simple CLI invocation.
 from __future__ import annotations
 
 import argparse
+import bisect
 import json
 import sys
 from datetime import datetime, timedelta, timezone
+from operator import itemgetter
 from pathlib import Path
 from typing import Optional
 
-from snapshot_store import DEFAULT_TIMESERIES_DIR, load_timeseries, list_snapshots, load_snapshot
+from snapshot_store import DEFAULT_TIMESERIES_DIR, load_timeseries, list_snapshots, load_snapshot, parse_ts
 
 
 # ---------------------------------------------------------------------------
@@ -25,34 +27,39 @@ def vote_accumulation_rate(
     model_name: str,
     days: int = 7,
     timeseries_dir: str | Path = DEFAULT_TIMESERIES_DIR,
+    now: Optional[datetime] = None,
 ) -> dict | None:
     """Compute the vote accumulation rate for a model over the last N days.
 
     Returns a dict with: model, start_votes, end_votes, delta, days_observed,
-    votes_per_day, or None if insufficient data.
+    votes_per_day, or None if insufficient data.  ``now`` overrides the
+    current time (shared across queries by the CLI, useful for testing).
     """
     records = load_timeseries(timeseries_dir)
     if not records:
         return None
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    if now is None:
+        now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=days)
     relevant: list[tuple[datetime, int]] = []
 
-    for rec in records:
-        ts = _parse_ts(rec.get("ts"))
+    for rec in records[_window_start(records, cutoff):]:
+        ts = parse_ts(rec.get("ts"))
         if ts is None:
             continue
         for m in rec.get("models", []):
-            if m.get("name") == model_name and m.get("votes") is not None:
-                if ts >= cutoff:
+            if m.get("name") == model_name:
+                if m.get("votes") is not None:
                     relevant.append((ts, m["votes"]))
+                break
 
     if len(relevant) < 2:
         return None
 
-    relevant.sort(key=lambda x: x[0])
-    start_ts, start_votes = relevant[0]
-    end_ts, end_votes = relevant[-1]
+    # Only the endpoints are needed, so skip sorting the whole list.
+    start_ts, start_votes = min(relevant, key=itemgetter(0))
+    end_ts, end_votes = max(relevant, key=itemgetter(0))
     days_observed = max((end_ts - start_ts).total_seconds() / 86400, 0.01)
 
     return {
@@ -77,9 +84,13 @@ def ci_threshold_date(
     records = load_timeseries(timeseries_dir)
     for rec in records:
         for m in rec.get("models", []):
-            if m.get("name") == model_name and m.get("ci") is not None:
-                if m["ci"] < threshold:
-                    return rec.get("ts")
+            if m.get("name") != model_name:
+                continue
+            # Names are unique within a record: stop scanning once found.
+            ci = m.get("ci")
+            if ci is not None and ci < threshold:
+                return rec.get("ts")
+            break
     return None
 
 
@@ -88,6 +99,7 @@ def score_trajectory(
     top_n: int = 5,
     days: int = 30,
     timeseries_dir: str | Path = DEFAULT_TIMESERIES_DIR,
+    now: Optional[datetime] = None,
 ) -> dict[str, list[dict]]:
     """Return the Elo score trajectory for models over the last N days.
 
@@ -96,6 +108,7 @@ def score_trajectory(
             the latest record.
         top_n: Number of top models to track if model_names is None.
         days: Number of days of history.
+        now: Override for "current time" (useful for testing).
 
     Returns:
         A dict mapping model name → list of {ts, score, rank} records.
@@ -104,7 +117,9 @@ def score_trajectory(
     if not records:
         return {}
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    if now is None:
+        now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=days)
 
     # Determine which models to track
     if model_names is None:
@@ -115,10 +130,12 @@ def score_trajectory(
     name_set = set(model_names)
     trajectories: dict[str, list[dict]] = {name: [] for name in model_names}
 
-    for rec in records:
-        ts = _parse_ts(rec.get("ts"))
-        if ts is None or ts < cutoff:
+    wanted = len(name_set)
+    for rec in records[_window_start(records, cutoff):]:
+        ts = parse_ts(rec.get("ts"))
+        if ts is None:
             continue
+        found = 0
         for m in rec.get("models", []):
             name = m.get("name")
             if name in name_set:
@@ -130,6 +147,10 @@ def score_trajectory(
                 if m.get("ci") is not None:
                     point["ci"] = m["ci"]
                 trajectories[name].append(point)
+                found += 1
+                # Tracked models are usually near the top of each record.
+                if found == wanted:
+                    break
 
     return trajectories
 
@@ -137,6 +158,7 @@ def score_trajectory(
 def rank_ub_changes(
     days: int = 7,
     timeseries_dir: str | Path = DEFAULT_TIMESERIES_DIR,
+    now: Optional[datetime] = None,
 ) -> list[dict]:
     """Find models whose Rank UB changed in the last N days.
 
@@ -146,28 +168,30 @@ def rank_ub_changes(
     if not records:
         return []
 
-    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    if now is None:
+        now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=days)
 
-    # Track first and last rank_ub per model
-    first_seen: dict[str, int] = {}
-    last_seen: dict[str, int] = {}
+    # Track [first, last] rank_ub per model in a single dict.
+    seen: dict[str, list[int]] = {}
+    seen_get = seen.get
 
-    for rec in records:
-        ts = _parse_ts(rec.get("ts"))
-        if ts is None or ts < cutoff:
+    for rec in records[_window_start(records, cutoff):]:
+        ts = parse_ts(rec.get("ts"))
+        if ts is None:
             continue
         for m in rec.get("models", []):
             name = m.get("name")
             ub = m.get("rank_ub")
             if name and ub is not None:
-                if name not in first_seen:
-                    first_seen[name] = ub
-                last_seen[name] = ub
+                entry = seen_get(name)
+                if entry is None:
+                    seen[name] = [ub, ub]
+                else:
+                    entry[1] = ub
 
     changes = []
-    for name in first_seen:
-        first = first_seen[name]
-        last = last_seen.get(name, first)
+    for name, (first, last) in seen.items():
         if first != last:
             changes.append({
                 "model": name,
@@ -182,6 +206,7 @@ def rank_ub_changes(
 
 def days_at_top(
     timeseries_dir: str | Path = DEFAULT_TIMESERIES_DIR,
+    now: Optional[datetime] = None,
 ) -> dict | None:
     """Determine how many days the current #1 model has held the top position.
 
@@ -201,36 +226,27 @@ def days_at_top(
     if not current_top:
         return None
 
-    # Walk backwards to find when this model first appeared at #1
-    first_at_top_ts = None
-    for rec in records:
-        models = rec.get("models", [])
-        if models and models[0].get("name") == current_top:
-            ts_str = rec.get("ts")
-            if ts_str:
-                first_at_top_ts = ts_str
-
-    if not first_at_top_ts:
-        return None
-
-    # Walk forward to find the earliest continuous run at #1
+    # Walk backwards from the latest record while the same model holds #1;
+    # the run ends at the first record where it does not.
     earliest_continuous = None
-    for rec in records:
+    for rec in reversed(records):
         models = rec.get("models", [])
-        if models and models[0].get("name") == current_top:
-            if earliest_continuous is None:
-                earliest_continuous = rec.get("ts")
-        else:
-            earliest_continuous = None
+        if not models or models[0].get("name") != current_top:
+            break
+        ts_str = rec.get("ts")
+        if ts_str:
+            earliest_continuous = ts_str
 
     if earliest_continuous is None:
-        earliest_continuous = first_at_top_ts
+        return None
 
-    first_dt = _parse_ts(earliest_continuous)
+    first_dt = parse_ts(earliest_continuous)
     if first_dt is None:
         return None
 
-    days_held = (datetime.now(timezone.utc) - first_dt).total_seconds() / 86400
+    if now is None:
+        now = datetime.now(timezone.utc)
+    days_held = (now - first_dt).total_seconds() / 86400
 
     return {
         "model": current_top,
@@ -243,13 +259,21 @@ def days_at_top(
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _parse_ts(ts_str: str | None) -> datetime | None:
-    if not ts_str:
-        return None
-    try:
-        return datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
-        return None
+def _window_start(records: list[dict], cutoff: datetime) -> int:
+    """Return the index of the first record at or after ``cutoff``.
+
+    The JSONL time series is append-only, so records are already in
+    timestamp order and the window start can be found by bisection.
+    """
+    return bisect.bisect_left(records, cutoff, key=_record_ts)
+
+
+_MIN_TS = datetime.min.replace(tzinfo=timezone.utc)
+
+
+def _record_ts(rec: dict) -> datetime:
+    # Unparseable timestamps compare as oldest; callers skip them anyway.
+    return parse_ts(rec.get("ts")) or _MIN_TS
 
 
 # ---------------------------------------------------------------------------
@@ -291,9 +315,10 @@ def main() -> int:
 
     args = parser.parse_args()
     ts_dir = args.timeseries_dir
+    now = datetime.now(timezone.utc)
 
     if args.command == "vote-rate":
-        result = vote_accumulation_rate(args.model, days=args.days, timeseries_dir=ts_dir)
+        result = vote_accumulation_rate(args.model, days=args.days, timeseries_dir=ts_dir, now=now)
         if result is None:
             print(f"Insufficient data for model '{args.model}' in the last {args.days} days.")
             return 1
@@ -308,7 +333,8 @@ def main() -> int:
 
     elif args.command == "score-trajectory":
         result = score_trajectory(
-            model_names=args.models, top_n=args.top_n, days=args.days, timeseries_dir=ts_dir
+            model_names=args.models, top_n=args.top_n, days=args.days, timeseries_dir=ts_dir,
+            now=now,
         )
         if not result:
             print("No trajectory data found.")
@@ -316,14 +342,14 @@ def main() -> int:
         print(json.dumps(result, indent=2))
 
     elif args.command == "rank-ub-changes":
-        result = rank_ub_changes(days=args.days, timeseries_dir=ts_dir)
+        result = rank_ub_changes(days=args.days, timeseries_dir=ts_dir, now=now)
         if not result:
             print(f"No Rank UB changes in the last {args.days} days.")
             return 0
         print(json.dumps(result, indent=2))
 
     elif args.command == "days-at-top":
-        result = days_at_top(timeseries_dir=ts_dir)
+        result = days_at_top(timeseries_dir=ts_dir, now=now)
         if result is None:
             print("No data available.")
             return 1
@@ -1,11 +1,16 @@
 #!/usr/bin/env python3
-"""Generate a self-contained HTML dashboard from leaderboard time series data.
+"""Generate an HTML dashboard from leaderboard time series data.
 
 Focused on Kalshi settlement decisions: shows only the models contending
 for #1 and the metrics that matter for predicting who will hold the top
 spot at settlement (score gaps, overtake probability, H2H win rates,
 vote accumulation / CI convergence).
 
+The chart data is written next to the HTML as ``<name>_data.js`` and
+loaded with a plain ``<script src>``, which also works from ``file://``.
+With ``--compress-data`` it is stored gzipped + base64 and inflated in the
+browser with ``DecompressionStream``.
+
 Usage:
     python dashboard.py                        # default paths
     python dashboard.py -o my_dashboard.html   # custom output
@@ -14,14 +19,34 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import base64
+import functools
+import gzip
+import hashlib
 import html
 import json
+import re
 import sys
+import urllib.parse
+from datetime import datetime
 from pathlib import Path
+from zoneinfo import ZoneInfo
 
 from snapshot_store import load_timeseries, DEFAULT_TIMESERIES_DIR
 
 DEFAULT_OUTPUT = "dashboard.html"
+DEFAULT_MAX_POINTS = 500
+# Part of the skip-regeneration digest: bump when the output depends on
+# code outside this module (e.g. how snapshot_store reads the time series).
+_DASHBOARD_VERSION = 1
+
+# Compact encoder reused across runs.  encode() takes the C-accelerated
+# one-shot path; json.dump() would fall back to the pure-Python iterencode.
+# Chart data is a plain tree of dicts and lists, so the circular-reference
+# check is skipped.
+_CHART_ENCODER = json.JSONEncoder(
+    ensure_ascii=False, separators=(",", ":"), check_circular=False,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -40,16 +65,19 @@ def extract_chart_data(timeseries: list[dict]) -> dict:
         leader       - name of current #1
         contenders   - ordered list of contender names
         score_gap    - {name: [leader_score - contender_score, ...]}
-        overtake     - {name: [prob, ...]}
-        h2h          - {name: [win_rate, ...]}
+        overtake     - {name: [prob_percent, ...]}      (contenders with data)
+        h2h          - {name: [win_rate_percent, ...]}  (contenders with data)
         votes        - {name: [total_votes, ...]}  (includes leader)
         ci           - {name: [ci_value, ...]}      (includes leader)
         leader_prob  - [prob_staying_1, ...]
+        series       - {"overtake": [names], "h2h": [names]} contenders
+                       with at least one non-null value in that series
     """
     empty = {
         "timestamps": [], "leader": None, "contenders": [],
         "score_gap": {}, "overtake": {}, "h2h": {},
         "votes": {}, "ci": {}, "leader_prob": [],
+        "series": {"overtake": [], "h2h": []},
     }
     if not timeseries:
         return empty
@@ -61,16 +89,67 @@ def extract_chart_data(timeseries: list[dict]) -> dict:
 
     leader_name = latest_models[0].get("name", "")
 
-    # --- Identify contenders ---
-    # From overtake data: any model with prob > 1% in any record.
-    contender_set: set[str] = set()
-    for record in timeseries:
-        for o in record.get("overtake_top5", []):
+    # --- Single pass over the records ---
+    # Every named model, overtake and H2H entry is scattered into per-name
+    # columns preallocated to the number of records.  Contenders depend on
+    # the whole history, so they are picked afterwards from the columns.
+    num_records = len(timeseries)
+    timestamps: list[str] = [""] * num_records
+    leader_prob: list[float | None] = [None] * num_records
+    model_cols: dict[str, tuple[list, list, list]] = {}
+    overtake_cols: dict[str, list] = {}
+    h2h_cols: dict[str, list] = {}
+    overtake_names: set[str] = set()
+
+    model_cols_get = model_cols.get
+    overtake_cols_get = overtake_cols.get
+    h2h_cols_get = h2h_cols.get
+
+    for i, record in enumerate(timeseries):
+        rec_get = record.get
+        timestamps[i] = rec_get("ts", "")
+        leader_prob[i] = rec_get("leader_prob_staying_1")
+
+        for m in rec_get("models", []):
+            m_get = m.get
+            name = m_get("name")
+            if not name:
+                continue
+            cols = model_cols_get(name)
+            if cols is None:
+                cols = model_cols[name] = (
+                    [None] * num_records, [None] * num_records, [None] * num_records,
+                )
+            cols[0][i] = m_get("score")
+            cols[1][i] = m_get("votes")
+            cols[2][i] = m_get("ci")
+
+        for o in rec_get("overtake_top5", []):
             name = o.get("name")
-            prob = o.get("prob", 0)
-            if name and prob and prob > 0.01:
-                contender_set.add(name)
+            if not name:
+                continue
+            col = overtake_cols_get(name)
+            if col is None:
+                col = overtake_cols[name] = [None] * num_records
+            prob = o.get("prob")
+            # Charted as percentages; scale here rather than in the page.
+            col[i] = round(prob * 100, 4) if prob is not None else None
+            # Any model with prob > 1% in any record.
+            if prob and prob > 0.01:
+                overtake_names.add(name)
+
+        for h in rec_get("h2h_top5", []):
+            name = h.get("name")
+            if not name:
+                continue
+            col = h2h_cols_get(name)
+            if col is None:
+                col = h2h_cols[name] = [None] * num_records
+            wr = h.get("wr")
+            col[i] = round(wr * 100, 4) if wr is not None else None
 
+    # --- Identify contenders ---
+    contender_set: set[str] = overtake_names
     # Fallback: if no overtake data, use #2 and #3 from latest snapshot.
     if not contender_set:
         for m in latest_models[1:3]:
@@ -79,11 +158,7 @@ def extract_chart_data(timeseries: list[dict]) -> dict:
                 contender_set.add(name)
 
     # Also include H2H models.
-    for record in timeseries:
-        for h in record.get("h2h_top5", []):
-            name = h.get("name")
-            if name:
-                contender_set.add(name)
+    contender_set |= h2h_cols.keys()
 
     contender_set.discard(leader_name)
     # Order by latest rank.
@@ -97,55 +172,38 @@ def extract_chart_data(timeseries: list[dict]) -> dict:
     # All models we need data for (leader + contenders).
     all_names = [leader_name] + contenders
 
-    # --- Build per-timestamp data ---
-    timestamps: list[str] = []
-    score_gap: dict[str, list[float | None]] = {n: [] for n in contenders}
-    overtake: dict[str, list[float | None]] = {n: [] for n in contenders}
-    h2h: dict[str, list[float | None]] = {n: [] for n in contenders}
-    votes: dict[str, list[int | None]] = {n: [] for n in all_names}
-    ci: dict[str, list[float | None]] = {n: [] for n in all_names}
-    leader_prob: list[float | None] = []
-
-    for record in timeseries:
-        timestamps.append(record.get("ts", ""))
-
-        # Model lookup for this snapshot.
-        model_lookup: dict[str, dict] = {}
-        for m in record.get("models", []):
-            name = m.get("name")
-            if name:
-                model_lookup[name] = m
-
-        leader = model_lookup.get(leader_name)
-        leader_score = leader.get("score") if leader else None
-
-        # Votes & CI for leader + all contenders.
-        for name in all_names:
-            m = model_lookup.get(name)
-            votes[name].append(m.get("votes") if m else None)
-            ci[name].append(m.get("ci") if m else None)
-
-        # Score gap, overtake, H2H for contenders only.
-        overtake_lookup = {}
-        for o in record.get("overtake_top5", []):
-            if o.get("name"):
-                overtake_lookup[o["name"]] = o.get("prob")
-        h2h_lookup = {}
-        for h in record.get("h2h_top5", []):
-            if h.get("name"):
-                h2h_lookup[h["name"]] = h.get("wr")
-
-        for name in contenders:
-            m = model_lookup.get(name)
-            contender_score = m.get("score") if m else None
-            if leader_score is not None and contender_score is not None:
-                score_gap[name].append(leader_score - contender_score)
-            else:
-                score_gap[name].append(None)
-            overtake[name].append(overtake_lookup.get(name))
-            h2h[name].append(h2h_lookup.get(name))
-
-        leader_prob.append(record.get("leader_prob_staying_1"))
+    tracked: dict[str, tuple[list, list, list]] = {}
+    for name in all_names:
+        cols = model_cols_get(name)
+        if cols is None:
+            cols = ([None] * num_records, [None] * num_records, [None] * num_records)
+        tracked[name] = cols
+
+    # Precompute which contenders have anything to plot so the page
+    # doesn't rescan every array on load; all-null series aren't shipped.
+    def has_data(col: list | None) -> bool:
+        return col is not None and any(v is not None for v in col)
+
+    series = {
+        "overtake": [n for n in contenders if has_data(overtake_cols_get(n))],
+        "h2h": [n for n in contenders if has_data(h2h_cols_get(n))],
+    }
+    overtake: dict[str, list[float | None]] = {n: overtake_cols[n] for n in series["overtake"]}
+    h2h: dict[str, list[float | None]] = {n: h2h_cols[n] for n in series["h2h"]}
+
+    # Score gaps only depend on the filled score columns, so compute them
+    # column-wise afterwards: one comprehension per contender.
+    leader_scores = tracked[leader_name][0]
+    score_gap: dict[str, list[float | None]] = {
+        name: [
+            lead - other if lead is not None and other is not None else None
+            for lead, other in zip(leader_scores, tracked[name][0])
+        ]
+        for name in contenders
+    }
+
+    votes: dict[str, list[int | None]] = {n: tracked[n][1] for n in all_names}
+    ci: dict[str, list[float | None]] = {n: tracked[n][2] for n in all_names}
 
     return {
         "timestamps": timestamps,
@@ -157,7 +215,105 @@ def extract_chart_data(timeseries: list[dict]) -> dict:
         "votes": votes,
         "ci": ci,
         "leader_prob": leader_prob,
+        "series": series,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Downsampling — keep long histories light in the browser
+# ---------------------------------------------------------------------------
+
+# Series that are actually plotted; leader_prob rides along unplotted.
+_CHARTED_SERIES = ("score_gap", "overtake", "h2h", "votes", "ci")
+
+
+def _lttb_indices(values: list, target: int) -> list[int]:
+    """Pick up to ``target`` indices of ``values`` with Largest-Triangle-Three-Buckets.
+
+    ``None`` entries are skipped; the first and last non-null points are
+    always kept.  The x coordinate is the record index.
+    """
+    points = [(i, v) for i, v in enumerate(values) if v is not None]
+    n = len(points)
+    if n <= target or target < 3:
+        return [i for i, _ in points]
+
+    every = (n - 2) / (target - 2)
+    picked = [points[0][0]]
+    ax, ay = points[0]
+    for b in range(target - 2):
+        # Average of the next bucket is the third triangle vertex.
+        avg_start = int((b + 1) * every) + 1
+        avg_end = min(int((b + 2) * every) + 1, n)
+        span = avg_end - avg_start
+        avg_x = sum(points[k][0] for k in range(avg_start, avg_end)) / span
+        avg_y = sum(points[k][1] for k in range(avg_start, avg_end)) / span
+
+        best_area = -1.0
+        best = None
+        for k in range(int(b * every) + 1, int((b + 1) * every) + 1):
+            x, y = points[k]
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = points[k]
+        if best is not None:
+            picked.append(best[0])
+            ax, ay = best
+    picked.append(points[-1][0])
+    return picked
+
+
+def _series_picks(values: list, max_points: int) -> list[int]:
+    """Indices to keep for one series: its LTTB picks plus gap markers.
+
+    The null right after each run of values is kept too, so the chart still
+    breaks the line there; markers share the ``max_points`` budget.
+    """
+    gaps = [i for i in range(1, len(values)) if values[i] is None and values[i - 1] is not None]
+    gap_budget = max_points // 4
+    if len(gaps) > gap_budget:
+        step = len(gaps) / gap_budget if gap_budget else 0
+        gaps = [gaps[int(k * step)] for k in range(gap_budget)]
+    return sorted(set(_lttb_indices(values, max(max_points - len(gaps), 3))) | set(gaps))
+
+
+def _downsample_chart_data(chart_data: dict, max_points: int) -> dict:
+    """Thin every plotted series to at most ``max_points`` points.
+
+    LTTB runs on each series separately, so each keeps its own peaks.
+    ``timestamps`` becomes the union of the records any series kept, and
+    ``points[key][name]`` lists the positions in it that the sliced
+    ``chart_data[key][name]`` values belong to.
+    """
+    timestamps = chart_data["timestamps"]
+    num_records = len(timestamps)
+    if num_records <= max_points:
+        return chart_data
+
+    picks = {
+        key: {name: _series_picks(values, max_points) for name, values in chart_data[key].items()}
+        for key in _CHARTED_SERIES
     }
+    keep = {0, num_records - 1}
+    for series_picks in picks.values():
+        for idx in series_picks.values():
+            keep.update(idx)
+    union = sorted(keep)
+    position = {record: pos for pos, record in enumerate(union)}
+
+    out = dict(chart_data)
+    out["timestamps"] = [timestamps[i] for i in union]
+    out["leader_prob"] = [chart_data["leader_prob"][i] for i in union]
+    out["points"] = {}
+    for key, series_picks in picks.items():
+        out[key] = {
+            name: [chart_data[key][name][i] for i in idx] for name, idx in series_picks.items()
+        }
+        out["points"][key] = {
+            name: [position[i] for i in idx] for name, idx in series_picks.items()
+        }
+    return out
 
 
 # ---------------------------------------------------------------------------
@@ -166,6 +322,7 @@ def extract_chart_data(timeseries: list[dict]) -> dict:
 
 _HTML_TEMPLATE = """\
 <!DOCTYPE html>
+<!-- source:__SOURCE_DIGEST__ -->
 <html lang="en">
 <head>
 <meta charset="utf-8">
@@ -209,7 +366,7 @@ _HTML_TEMPLATE = """\
     font-size: 0.8em;
     margin-bottom: 4px;
   }
-  .chart { width: 100%%; height: 380px; }
+  .chart { width: 100%; height: 380px; }
   .grid { display: grid; grid-template-columns: 1fr 1fr; gap: 20px; }
   @media (max-width: 900px) { .grid { grid-template-columns: 1fr; } }
   .note {
@@ -222,7 +379,7 @@ _HTML_TEMPLATE = """\
 </head>
 <body>
 <h1>Kalshi Settlement Dashboard</h1>
-<div class="subtitle">%(leader_label)s &mdash; Generated: %(generated_at)s &mdash; %(num_records)d snapshots</div>
+<div class="subtitle">__LEADER_LABEL__ &mdash; Generated: __GENERATED_AT__ &mdash; __NUM_RECORDS__ snapshots</div>
 
 <div class="chart-container">
   <h2>Score Gap to #1</h2>
@@ -238,7 +395,7 @@ _HTML_TEMPLATE = """\
   </div>
   <div class="chart-container">
     <h2>H2H Win Rate vs #1</h2>
-    <p class="chart-note">Predicted head-to-head win %% (Bradley-Terry / Elo).</p>
+    <p class="chart-note">Predicted head-to-head win % (Bradley-Terry / Elo).</p>
     <div id="chart-h2h" class="chart"></div>
   </div>
 </div>
@@ -258,8 +415,14 @@ _HTML_TEMPLATE = """\
 
 <div class="note">Data: data/timeseries/top20.jsonl &mdash; auto-regenerated on each leaderboard check</div>
 
-<script>
-const D = %(chart_data_json)s;
+<script src="__DATA_SRC__"></script>
+<script type="module">
+async function inflate(b64) {
+  const bytes = Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+  const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+  return JSON.parse(await new Response(stream).text());
+}
+const D = typeof DATA_GZ === 'undefined' ? DATA : await inflate(DATA_GZ);
 const CONTENDERS = D.contenders || [];
 const LEADER = D.leader || '';
 const ALL = [LEADER].concat(CONTENDERS).filter(Boolean);
@@ -277,143 +440,201 @@ const LAYOUT = {
 const CFG = { responsive: true, displayModeBar: false };
 
 const COLORS = ['#e94560', '#53d8fb', '#f0a500', '#48c774', '#a55eea', '#fd9644'];
-function color(i) { return COLORS[i %% COLORS.length]; }
+function color(i) { return COLORS[i % COLORS.length]; }
 
-// --- Score Gap chart ---
-(function() {
-  if (!CONTENDERS.length) return;
-  const traces = CONTENDERS.map((name, i) => ({
-    x: D.timestamps, y: D.score_gap[name], name: name,
-    type: 'scatter', mode: 'lines+markers',
-    line: { color: color(i), width: 2.5 }, marker: { size: 5 },
-    connectgaps: false,
-  }));
-  // Zero reference line.
-  traces.push({
+// Downsampled data gives each series its own points (indices into timestamps).
+function xValues(key, name) {
+  return D.points ? D.points[key][name].map(i => D.timestamps[i]) : D.timestamps;
+}
+
+// One trace per model; the leader (votes / CI charts) is drawn dotted and heavier.
+function lineTraces(names, key, width) {
+  return names.map((name, i) => {
+    const lead = name === LEADER;
+    return {
+      x: xValues(key, name), y: D[key][name], name: name,
+      type: 'scattergl', mode: 'lines+markers',
+      line: { color: color(i), width: lead ? 3 : width, dash: lead ? 'dot' : 'solid' },
+      marker: { size: lead ? 6 : 5 },
+      connectgaps: false,
+    };
+  });
+}
+
+// Dashed horizontal reference line across the full time range.
+function refLine(y, name) {
+  return {
     x: [D.timestamps[0], D.timestamps[D.timestamps.length - 1]],
-    y: [0, 0], name: 'Tied', type: 'scatter', mode: 'lines',
+    y: [y, y], name: name, type: 'scatter', mode: 'lines',
     line: { color: '#666', width: 1, dash: 'dash' }, showlegend: false,
-  });
-  Plotly.newPlot('chart-gap', traces, {
-    ...LAYOUT,
-    yaxis: { ...LAYOUT.yaxis, title: 'Points behind #1' },
-  }, CFG);
-})();
+  };
+}
+
+function plot(id, traces, yaxis) {
+  Plotly.newPlot(id, traces, { ...LAYOUT, yaxis: { ...LAYOUT.yaxis, ...yaxis } }, CFG);
+}
+
+function noData(id, message) {
+  document.getElementById(id).innerHTML =
+    '<p style="text-align:center;color:#888;padding:40px;">' + message + '</p>';
+}
+
+// --- Score Gap chart ---
+if (CONTENDERS.length) {
+  plot('chart-gap', [...lineTraces(CONTENDERS, 'score_gap', 2.5), refLine(0, 'Tied')],
+       { title: 'Points behind #1' });
+}
 
 // --- Overtake probability chart ---
-(function() {
-  const names = CONTENDERS.filter(n => D.overtake[n] && D.overtake[n].some(v => v != null));
-  if (!names.length) {
-    document.getElementById('chart-overtake').innerHTML =
-      '<p style="text-align:center;color:#888;padding:40px;">No overtake data yet.</p>';
-    return;
-  }
-  const traces = names.map((name, i) => ({
-    x: D.timestamps, y: D.overtake[name].map(v => v != null ? v * 100 : null),
-    name: name, type: 'scatter', mode: 'lines+markers',
-    line: { color: color(i), width: 2.5 }, marker: { size: 5 },
-    connectgaps: false,
-  }));
-  Plotly.newPlot('chart-overtake', traces, {
-    ...LAYOUT,
-    yaxis: { ...LAYOUT.yaxis, title: 'Overtake %%', rangemode: 'tozero' },
-  }, CFG);
-})();
+if (D.series.overtake.length) {
+  plot('chart-overtake', lineTraces(D.series.overtake, 'overtake', 2.5),
+       { title: 'Overtake %', rangemode: 'tozero' });
+} else {
+  noData('chart-overtake', 'No overtake data yet.');
+}
 
 // --- H2H win rate chart ---
-(function() {
-  const names = CONTENDERS.filter(n => D.h2h[n] && D.h2h[n].some(v => v != null));
-  if (!names.length) {
-    document.getElementById('chart-h2h').innerHTML =
-      '<p style="text-align:center;color:#888;padding:40px;">No H2H data yet.</p>';
-    return;
-  }
-  const traces = names.map((name, i) => ({
-    x: D.timestamps, y: D.h2h[name].map(v => v != null ? v * 100 : null),
-    name: name, type: 'scatter', mode: 'lines+markers',
-    line: { color: color(i), width: 2.5 }, marker: { size: 5 },
-    connectgaps: false,
-  }));
-  traces.push({
-    x: [D.timestamps[0], D.timestamps[D.timestamps.length - 1]],
-    y: [50, 50], name: '50%%', type: 'scatter', mode: 'lines',
-    line: { color: '#666', width: 1, dash: 'dash' }, showlegend: false,
-  });
-  Plotly.newPlot('chart-h2h', traces, {
-    ...LAYOUT,
-    yaxis: { ...LAYOUT.yaxis, title: 'Win Rate vs #1 %%' },
-  }, CFG);
-})();
-
-// --- Votes chart (leader + contenders) ---
-(function() {
-  if (!ALL.length) return;
-  const traces = ALL.map((name, i) => ({
-    x: D.timestamps, y: D.votes[name], name: name,
-    type: 'scatter', mode: 'lines+markers',
-    line: { color: color(i), width: name === LEADER ? 3 : 2, dash: name === LEADER ? 'dot' : 'solid' },
-    marker: { size: name === LEADER ? 6 : 5 },
-    connectgaps: false,
-  }));
-  Plotly.newPlot('chart-votes', traces, {
-    ...LAYOUT,
-    yaxis: { ...LAYOUT.yaxis, title: 'Total Votes' },
-  }, CFG);
-})();
-
-// --- CI chart (leader + contenders) ---
-(function() {
-  if (!ALL.length) return;
-  const traces = ALL.map((name, i) => ({
-    x: D.timestamps, y: D.ci[name], name: name,
-    type: 'scatter', mode: 'lines+markers',
-    line: { color: color(i), width: name === LEADER ? 3 : 2, dash: name === LEADER ? 'dot' : 'solid' },
-    marker: { size: name === LEADER ? 6 : 5 },
-    connectgaps: false,
-  }));
-  Plotly.newPlot('chart-ci', traces, {
-    ...LAYOUT,
-    yaxis: { ...LAYOUT.yaxis, title: 'CI (±points)' },
-  }, CFG);
-})();
+if (D.series.h2h.length) {
+  plot('chart-h2h', [...lineTraces(D.series.h2h, 'h2h', 2.5), refLine(50, '50%')],
+       { title: 'Win Rate vs #1 %' });
+} else {
+  noData('chart-h2h', 'No H2H data yet.');
+}
+
+// --- Votes and CI charts (leader + contenders) ---
+if (ALL.length) {
+  plot('chart-votes', lineTraces(ALL, 'votes', 2), { title: 'Total Votes' });
+  plot('chart-ci', lineTraces(ALL, 'ci', 2), { title: 'CI (±points)' });
+}
 </script>
 </body>
 </html>
 """
 
 
+# Placeholders are __NAME__ sentinels, so CSS/JS keep literal % signs.  The
+# template is split once; odd-indexed parts are placeholder names.
+_TEMPLATE_PARTS = re.split(r"__([A-Z][A-Z_]*)__", _HTML_TEMPLATE)
+
+
+def _render_template(values: dict[str, str]) -> str:
+    parts = list(_TEMPLATE_PARTS)
+    parts[1::2] = [values[name] for name in parts[1::2]]
+    return "".join(parts)
+
+
 def generate_dashboard(
     timeseries_dir: str | Path = DEFAULT_TIMESERIES_DIR,
     output_path: str | Path = DEFAULT_OUTPUT,
+    max_points: int | None = DEFAULT_MAX_POINTS,
+    compress_data: bool = False,
 ) -> Path:
-    """Generate the HTML dashboard file.
+    """Generate the HTML dashboard file and its chart data script.
+
+    Histories longer than ``max_points`` records are downsampled (LTTB)
+    before embedding; pass None to keep every point.  ``compress_data``
+    stores the chart data gzipped + base64 (several times smaller; needs a
+    browser with ``DecompressionStream``).
+
+    If the existing output was built from the same time series contents
+    and settings, it is left untouched and nothing is re-rendered.
 
     Returns the path to the generated HTML file.
     """
-    from datetime import datetime
-    from zoneinfo import ZoneInfo
+    output_path = Path(output_path)
+    data_path = _data_path(output_path)
+    source_digest = _source_digest(timeseries_dir, max_points, compress_data)
+    if data_path.exists() and _existing_digest(output_path) == source_digest:
+        return output_path
 
     timeseries = load_timeseries(timeseries_dir)
     chart_data = extract_chart_data(timeseries)
+    if max_points:
+        chart_data = _downsample_chart_data(chart_data, max_points)
 
-    ct_now = datetime.now(ZoneInfo("America/Chicago"))
+    ct_now = datetime.now(_central_tz())
     generated_at = ct_now.strftime("%Y-%m-%d %H:%M:%S %Z")
 
     leader = chart_data.get("leader") or "No data"
     leader_label = f"Current #1: {html.escape(leader)}" if leader else "No data"
 
-    html_content = _HTML_TEMPLATE % {
-        "generated_at": html.escape(generated_at),
-        "num_records": len(timeseries),
-        "leader_label": leader_label,
-        "chart_data_json": json.dumps(chart_data, ensure_ascii=False),
-    }
-
-    output_path = Path(output_path)
+    payload = _CHART_ENCODER.encode(chart_data)
+    with open(data_path, "w", encoding="utf-8") as f:
+        if compress_data:
+            blob = gzip.compress(payload.encode("utf-8"), compresslevel=6)
+            f.write('const DATA_GZ = "')
+            f.write(base64.b64encode(blob).decode("ascii"))
+            f.write('";\n')
+        else:
+            f.write("const DATA = ")
+            f.write(payload)
+            f.write(";\n")
+
+    html_content = _render_template({
+        "GENERATED_AT": html.escape(generated_at),
+        "NUM_RECORDS": str(len(timeseries)),
+        "LEADER_LABEL": leader_label,
+        "DATA_SRC": html.escape(urllib.parse.quote(data_path.name)),
+        "SOURCE_DIGEST": source_digest,
+    })
     output_path.write_text(html_content, encoding="utf-8")
     return output_path
 
 
+@functools.lru_cache(maxsize=1)
+def _central_tz() -> ZoneInfo:
+    # Resolved on first use, not at import: Windows hosts without the
+    # tzdata package would otherwise fail to import this module at all.
+    return ZoneInfo("America/Chicago")
+
+
+def _source_digest(
+    timeseries_dir: str | Path,
+    max_points: int | None,
+    compress_data: bool,
+) -> str:
+    """Fingerprint everything the dashboard output depends on.
+
+    Covers the version constant, this module's source (template, extraction
+    and downsampling code), the output options and the time series bytes.
+    """
+    h = hashlib.blake2b(digest_size=8)
+    h.update(f"v{_DASHBOARD_VERSION}\0max_points={max_points}\0compress={compress_data}\0".encode("ascii"))
+    try:
+        h.update(Path(__file__).read_bytes())
+    except OSError:
+        h.update(_HTML_TEMPLATE.encode("utf-8"))
+    try:
+        with open(Path(timeseries_dir) / "top20.jsonl", "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 16), b""):
+                h.update(chunk)
+    except OSError:
+        pass
+    return h.hexdigest()
+
+
+def _existing_digest(output_path: Path) -> str | None:
+    """Return the source digest embedded in a previously generated dashboard."""
+    try:
+        with open(output_path, "rb") as f:
+            head = f.read(256).decode("utf-8", "replace")
+    except OSError:
+        return None
+    marker = "<!-- source:"
+    start = head.find(marker)
+    if start < 0:
+        return None
+    start += len(marker)
+    end = head.find(" -->", start)
+    return head[start:end] if end > start else None
+
+
+def _data_path(output_path: str | Path) -> Path:
+    """Return the chart data script path that accompanies a dashboard HTML file."""
+    output_path = Path(output_path)
+    return output_path.with_name(output_path.stem + "_data.js")
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
@@ -428,11 +649,25 @@ def main() -> int:
         "-o", "--output", type=Path, default=Path(DEFAULT_OUTPUT),
         help=f"Output HTML file path (default: {DEFAULT_OUTPUT})",
     )
+    parser.add_argument(
+        "--max-points", type=int, default=DEFAULT_MAX_POINTS,
+        help=f"Downsample charts to at most this many points per series (default: {DEFAULT_MAX_POINTS})",
+    )
+    parser.add_argument(
+        "--no-downsample", action="store_true",
+        help="Embed every record instead of downsampling long histories",
+    )
+    parser.add_argument(
+        "--compress-data", action="store_true",
+        help="Store chart data gzipped + base64 (smaller; needs a modern browser)",
+    )
     args = parser.parse_args()
 
     output = generate_dashboard(
         timeseries_dir=args.timeseries_dir,
         output_path=args.output,
+        max_points=None if args.no_downsample else args.max_points,
+        compress_data=args.compress_data,
     )
     print(f"Dashboard generated: {output}")
     return 0
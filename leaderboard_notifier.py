@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import gzip
 import hashlib
 import json
 import os
@@ -13,6 +14,8 @@ import socket
 import sys
 import textwrap
 import time
+import zlib
+from collections import deque
 from datetime import datetime, timezone
 from zoneinfo import ZoneInfo
 from html import unescape
@@ -21,6 +24,8 @@ from typing import Callable, TypeVar
 from urllib import error, request
 from urllib.parse import urlparse
 
+from snapshot_store import write_text_atomic
+
 DEFAULT_URL = "https://arena.ai/leaderboard/text/overall-no-style-control"
 DEFAULT_STATE_FILE = "leaderboard_state.json"
 DEFAULT_TIMEOUT = 30
@@ -36,63 +41,132 @@ DEFAULT_SNAPSHOT_DIR = "data/snapshots"
 DEFAULT_TIMESERIES_DIR = "data/timeseries"
 DEFAULT_STRUCTURED_CACHE = "data/structured_snapshot.json"
 
-
-def fetch_html(url: str, timeout: int) -> str:
-    req = request.Request(
-        url,
-        headers={
-            "User-Agent": (
-                "Mozilla/5.0 (X11; Linux x86_64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) "
-                "Chrome/123.0.0.0 Safari/537.36"
-            )
-        },
-    )
-    with request.urlopen(req, timeout=timeout) as response:
-        charset = response.headers.get_content_charset() or "utf-8"
-        return response.read().decode(charset, errors="replace")
+# Patterns used on every check, compiled once at import.
+_RE_TAG = re.compile(r"<[^>]+>")
+_RE_COMMENT = re.compile(r"<!--.*?-->", re.S)
+_RE_SCRIPT = re.compile(r"<script\b[^>]*>.*?</script>", re.I | re.S)
+_RE_STYLE = re.compile(r"<style\b[^>]*>.*?</style>", re.I | re.S)
+_RE_NAV = re.compile(r"<(?:nav|footer|aside)\b[^>]*>.*?</(?:nav|footer|aside)>", re.I | re.S)
+
+_RE_TIMESTAMP_LABEL = re.compile(
+    r"\b(?:last\s+updated|updated\s+at|generated\s+at|timestamp)\b[^\n<]{0,80}", re.I
+)
+_RE_ISO_DATETIME = re.compile(r"\b\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(?::\d{2})?(?:\s*UTC|\s*GMT|Z)?\b", re.I)
+_RE_TRACKING = re.compile(r"\b(?:ga|gtm|utm_[a-z_]+|analytics|tracking)\b", re.I)
+# Leaderboard anchors fused into one alternation so the page is scanned
+# once.  None of the alternatives can start inside another's match and end
+# beyond it, so the first/last spans equal those of separate scans.
+_RE_ANCHOR = re.compile(
+    "|".join(
+        f"(?:{pattern})"
+        for pattern in (
+            r"arena\s+llm\s+leaderboard",
+            r"overall[-\s]+no[-\s]+style[-\s]+control",
+            r"(?:id|class)=[\"'][^\"']*leaderboard[^\"']*[\"']",
+            r">\s*leaderboard\s*<",
+            r"\b(?:rank|model|score|elo)\b",
+        )
+    ),
+    re.I,
+)
+# Every anchor alternative contains one of these words.
+_ANCHOR_LITERALS = ("arena", "overall", "leaderboard", "rank", "model", "score", "elo")
+_RE_LEADERBOARD_PATH = re.compile(r"(?:^|/)leaderboard(?:/|$)")
+# Rank and score cells are ASCII digits; re.ASCII skips the Unicode
+# digit tables.
+_RE_INT = re.compile(r"\d+", re.ASCII)
+_RE_NUMBER = re.compile(r"-?\d+(?:\.\d+)?", re.ASCII)
+_RE_LETTER = re.compile(r"[a-z]", re.I)
+_RE_TABLE = re.compile(r"<table\b[^>]*>.*?</table>", re.I | re.S)
+_RE_ROW = re.compile(r"<tr\b[^>]*>.*?</tr>", re.I | re.S)
+_RE_CELL = re.compile(r"<t[dh]\b[^>]*>(.*?)</t[dh]>", re.I | re.S)
+_RE_RANK_WORD = re.compile(r"\brank\b", re.I)
+_RE_MODEL_WORD = re.compile(r"\bmodel\b", re.I)
+
+
+def fetch_html(url: str, timeout: int, validators: dict | None = None) -> str | None:
+    """Fetch ``url`` and return its decoded body.
+
+    When ``validators`` holds an ``etag``/``last_modified`` from a previous
+    fetch, the request is made conditional and ``None`` is returned if the
+    server answers 304 Not Modified.  On a full response the dict is updated
+    in place with the new validators (or emptied if the server sent none).
+    """
+    headers = {
+        "User-Agent": (
+            "Mozilla/5.0 (X11; Linux x86_64) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/123.0.0.0 Safari/537.36"
+        ),
+        # The page compresses to a fraction of its size; brotli would need a
+        # third-party decoder, so only gzip is offered.
+        "Accept-Encoding": "gzip",
+    }
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+    req = request.Request(url, headers=headers)
+    try:
+        with request.urlopen(req, timeout=timeout) as response:
+            response_headers = response.headers
+            data = response.read()
+    except error.HTTPError as exc:
+        if exc.code == 304 and validators:
+            return None
+        raise
+    if response_headers.get("Content-Encoding", "").strip().lower() == "gzip":
+        try:
+            data = gzip.decompress(data)
+        except (gzip.BadGzipFile, EOFError, zlib.error) as exc:
+            # A truncated or corrupt body is a failed fetch, not a crash.
+            raise error.URLError(f"invalid gzip response body: {exc}") from exc
+    charset = response_headers.get_content_charset() or "utf-8"
+    if validators is not None:
+        validators.clear()
+        if response_headers.get("ETag"):
+            validators["etag"] = response_headers["ETag"]
+        if response_headers.get("Last-Modified"):
+            validators["last_modified"] = response_headers["Last-Modified"]
+    return data.decode(charset, errors="replace")
+
+
+def _anchor_bounds(base_html: str) -> tuple[int, int]:
+    """Return the first anchor start and last anchor end, or ``(-1, -1)``."""
+    # Pages without any anchor word skip the case-insensitive scan.  casefold()
+    # maps every character re.I equates with an ASCII letter (including the
+    # long s, which lower() keeps) onto that letter.
+    haystack = base_html.casefold()
+    if not any(literal in haystack for literal in _ANCHOR_LITERALS):
+        return -1, -1
+
+    first = _RE_ANCHOR.search(base_html)
+    if first is None:
+        return -1, -1
+    # Matches are non-overlapping and ordered, so the last one has the
+    # largest end; the deque drains the iterator without a Python loop.
+    last = deque(_RE_ANCHOR.finditer(base_html, first.end()), maxlen=1)
+    return first.start(), (last[0] if last else first).end()
 
 
 def normalize_html_for_hash(html: str) -> str:
     def normalize_text(content: str) -> str:
-        text_only = re.sub(r"<[^>]+>", " ", content)
+        text_only = _RE_TAG.sub(" ", content)
         text_only = unescape(text_only)
-        text_only = re.sub(
-            r"\b(?:last\s+updated|updated\s+at|generated\s+at|timestamp)\b[^\n<]{0,80}",
-            " ",
-            text_only,
-            flags=re.I,
-        )
-        text_only = re.sub(
-            r"\b\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}(?::\d{2})?(?:\s*UTC|\s*GMT|Z)?\b",
-            " ",
-            text_only,
-            flags=re.I,
-        )
-        text_only = re.sub(r"\b(?:ga|gtm|utm_[a-z_]+|analytics|tracking)\b", " ", text_only, flags=re.I)
-        return re.sub(r"\s+", " ", text_only).strip()
-
-    base_html = re.sub(r"<!--.*?-->", " ", html, flags=re.S)
-    base_html = re.sub(r"<script\b[^>]*>.*?</script>", " ", base_html, flags=re.I | re.S)
-    base_html = re.sub(r"<style\b[^>]*>.*?</style>", " ", base_html, flags=re.I | re.S)
-    base_html = re.sub(r"<(?:nav|footer|aside)\b[^>]*>.*?</(?:nav|footer|aside)>", " ", base_html, flags=re.I | re.S)
-
-    anchor_patterns = [
-        r"(?i)arena\s+llm\s+leaderboard",
-        r"(?i)overall[-\s]+no[-\s]+style[-\s]+control",
-        r"(?i)(?:id|class)=[\"'][^\"']*leaderboard[^\"']*[\"']",
-        r"(?i)>\s*leaderboard\s*<",
-        r"(?i)\b(?:rank|model|score|elo)\b",
-    ]
-
-    match_spans: list[tuple[int, int]] = []
-    for pattern in anchor_patterns:
-        for match in re.finditer(pattern, base_html):
-            match_spans.append((match.start(), match.end()))
-
-    if match_spans:
-        min_start = min(start for start, _ in match_spans)
-        max_end = max(end for _, end in match_spans)
+        text_only = _RE_TIMESTAMP_LABEL.sub(" ", text_only)
+        text_only = _RE_ISO_DATETIME.sub(" ", text_only)
+        text_only = _RE_TRACKING.sub(" ", text_only)
+        # str.split() breaks on exactly the characters re's \s matches.
+        return " ".join(text_only.split())
+
+    base_html = _RE_COMMENT.sub(" ", html)
+    base_html = _RE_SCRIPT.sub(" ", base_html)
+    base_html = _RE_STYLE.sub(" ", base_html)
+    base_html = _RE_NAV.sub(" ", base_html)
+
+    min_start, max_end = _anchor_bounds(base_html)
+    if min_start >= 0:
         padding = 5000
         focused_region = base_html[max(0, min_start - padding) : min(len(base_html), max_end + padding)]
         normalized_focused = normalize_text(focused_region)
@@ -106,14 +180,23 @@ def normalize_html_for_hash(html: str) -> str:
     return normalize_text(base_html)
 
 
+_HASH_CHUNK_CHARS = 1 << 20
+
+
 def compute_hash(value: str) -> str:
-    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+    # Encode in slices so a whole-page fallback fingerprint never needs a
+    # second full-size bytes copy; UTF-8 of the slices concatenates to the
+    # UTF-8 of the whole string, so the digest is unchanged.
+    digest = hashlib.sha256()
+    for start in range(0, len(value), _HASH_CHUNK_CHARS):
+        digest.update(value[start : start + _HASH_CHUNK_CHARS].encode("utf-8"))
+    return digest.hexdigest()
 
 
 def is_leaderboard_url(url: str) -> bool:
     parsed = urlparse(url)
     path = (parsed.path or "").lower()
-    return re.search(r"(?:^|/)leaderboard(?:/|$)", path) is not None
+    return _RE_LEADERBOARD_PATH.search(path) is not None
 
 
 def page_subject(url: str) -> str:
@@ -121,13 +204,13 @@ def page_subject(url: str) -> str:
 
 
 def _strip_html(value: str) -> str:
-    stripped = re.sub(r"<[^>]+>", " ", value)
+    stripped = _RE_TAG.sub(" ", value)
     stripped = unescape(stripped)
-    return re.sub(r"\s+", " ", stripped).strip()
+    return " ".join(stripped.split())
 
 
 def _parse_rank(cell: str) -> int | None:
-    match = re.search(r"\d+", cell)
+    match = _RE_INT.search(cell)
     if not match:
         return None
     try:
@@ -137,7 +220,7 @@ def _parse_rank(cell: str) -> int | None:
 
 
 def _parse_score(cell: str) -> float | None:
-    match = re.search(r"-?\d+(?:\.\d+)?", cell.replace(",", ""))
+    match = _RE_NUMBER.search(cell.replace(",", ""))
     if not match:
         return None
     try:
@@ -152,7 +235,7 @@ def _is_plausible_model_name(value: str) -> bool:
         return False
     if normalized.lower() == "model":
         return False
-    if not re.search(r"[a-z]", normalized, flags=re.I):
+    if not _RE_LETTER.search(normalized):
         return False
     return True
 
@@ -160,22 +243,28 @@ def _is_plausible_model_name(value: str) -> bool:
 def _parse_snapshot_rows(row_html_blocks: list[str]) -> list[dict]:
     snapshots: list[dict] = []
     for row_html in row_html_blocks:
-        cells_raw = re.findall(r"<t[dh]\b[^>]*>(.*?)</t[dh]>", row_html, flags=re.I | re.S)
-        cells = [_strip_html(cell) for cell in cells_raw]
-        cells = [cell for cell in cells if cell]
-        if len(cells) < 2:
+        # Cells are stripped lazily: header/filler rows are rejected on their
+        # first cell and scoring stops at the first numeric cell, so the
+        # remaining columns of wide rows are never touched.
+        cells = (
+            cell
+            for cell in (_strip_html(match.group(1)) for match in _RE_CELL.finditer(row_html))
+            if cell
+        )
+        rank_cell = next(cells, None)
+        model_name = next(cells, None)
+        if model_name is None:
             continue
 
-        rank = _parse_rank(cells[0])
+        rank = _parse_rank(rank_cell)
         if rank is None or rank <= 0 or rank > 1000:
             continue
 
-        model_name = cells[1]
         if not _is_plausible_model_name(model_name):
             continue
 
         score = None
-        for cell in cells[2:]:
+        for cell in cells:
             score = _parse_score(cell)
             if score is not None:
                 break
@@ -189,12 +278,12 @@ def _parse_snapshot_rows(row_html_blocks: list[str]) -> list[dict]:
 
 def parse_leaderboard_snapshot(html: str, top_n: int = DEFAULT_SNAPSHOT_TOP_N) -> list[dict]:
     table_snapshots: list[list[dict]] = []
-    for table_html in re.findall(r"<table\b[^>]*>.*?</table>", html, flags=re.I | re.S):
-        if re.search(r"\brank\b", table_html, flags=re.I) is None:
+    for table_html in _RE_TABLE.findall(html):
+        if _RE_RANK_WORD.search(table_html) is None:
             continue
-        if re.search(r"\bmodel\b", table_html, flags=re.I) is None:
+        if _RE_MODEL_WORD.search(table_html) is None:
             continue
-        row_blocks = re.findall(r"<tr\b[^>]*>.*?</tr>", table_html, flags=re.I | re.S)
+        row_blocks = _RE_ROW.findall(table_html)
         table_snapshot = _parse_snapshot_rows(row_blocks)
         if table_snapshot:
             table_snapshots.append(table_snapshot)
@@ -202,7 +291,7 @@ def parse_leaderboard_snapshot(html: str, top_n: int = DEFAULT_SNAPSHOT_TOP_N) -
     if table_snapshots:
         snapshots = max(table_snapshots, key=len)
     else:
-        row_blocks = re.findall(r"<tr\b[^>]*>.*?</tr>", html, flags=re.I | re.S)
+        row_blocks = _RE_ROW.findall(html)
         snapshots = _parse_snapshot_rows(row_blocks)
 
     snapshots.sort(key=lambda item: (item["rank"], item.get("model", "")))
@@ -290,7 +379,10 @@ def load_state(path: Path) -> dict:
 
 
 def save_state(path: Path, state: dict) -> None:
-    path.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    # Written atomically: a crash mid-write must not leave a truncated file,
+    # which load_state would read as {} and the next check would treat as a
+    # first run.
+    write_text_atomic(path, json.dumps(state, indent=2, sort_keys=True) + "\n")
 
 
 def send_discord_message(webhook_url: str, message: str, timeout: int) -> None:
@@ -302,7 +394,9 @@ def send_discord_message(webhook_url: str, message: str, timeout: int) -> None:
     if parsed_webhook_url.scheme != "https" or parsed_webhook_url.netloc not in DISCORD_WEBHOOK_HOSTS:
         raise ValueError("Webhook URL does not look like a Discord webhook URL")
 
-    payload = json.dumps({"content": message}).encode("utf-8")
+    # UTF-8 rather than \uXXXX escapes: the emoji and arrows in messages
+    # are then 3-4 bytes each instead of 6-12.
+    payload = json.dumps({"content": message}, ensure_ascii=False).encode("utf-8")
     req = request.Request(
         cleaned_webhook_url,
         data=payload,
@@ -368,8 +462,9 @@ def build_message(
     previous_snapshot: list[dict] | None = None,
     current_snapshot: list[dict] | None = None,
     use_legacy_hash_message: bool = False,
+    checked_at: datetime | None = None,
 ) -> str:
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    timestamp = (checked_at or datetime.now(timezone.utc)).strftime("%Y-%m-%d %H:%M:%S UTC")
     old_display = old_hash[:12] if old_hash else "(none)"
     subject = page_subject(url)
 
@@ -436,8 +531,12 @@ def build_message(
     return bound_message_length("\n".join(sections), url)
 
 
-def build_force_send_no_change_message(url: str, existing_hash: str | None) -> str:
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+def build_force_send_no_change_message(
+    url: str,
+    existing_hash: str | None,
+    checked_at: datetime | None = None,
+) -> str:
+    timestamp = (checked_at or datetime.now(timezone.utc)).strftime("%Y-%m-%d %H:%M:%S UTC")
     hash_display = existing_hash[:12] if existing_hash else "(none)"
     subject = page_subject(url)
     message = textwrap.dedent(
@@ -493,6 +592,14 @@ def parse_args() -> argparse.Namespace:
             f"before notifying (default: {DEFAULT_CONFIRMATION_CHECKS})"
         ),
     )
+    parser.add_argument(
+        "--confirmation-delay-seconds",
+        type=int,
+        help=(
+            "In --loop mode, wait this long (instead of a full randomized "
+            "interval) before re-checking a fingerprint awaiting confirmation"
+        ),
+    )
     parser.add_argument(
         "--force-send",
         action="store_true",
@@ -551,12 +658,32 @@ def parse_args() -> argparse.Namespace:
     return parser.parse_args()
 
 
+# url -> (raw body hash, normalized fingerprint, legacy snapshot) from the
+# last full fetch, kept across --loop iterations.
+_page_cache: dict[str, tuple[str, str, list[dict] | None]] = {}
+
+
 def run_single_check(args: argparse.Namespace) -> int:
+    state = load_state(args.state_file)
+
+    # Only make the fetch conditional when the stored fingerprint is settled:
+    # a 304 then means "same as the confirmed hash", so hashing and parsing
+    # can be skipped.  Pending confirmations and forced sends need the body.
+    validators: dict = {}
+    if (
+        not args.force_send
+        and state.get("url") == args.url
+        and state.get("hash")
+        and state.get("pending_hash") in (None, state.get("hash"))
+    ):
+        for key in ("etag", "last_modified"):
+            if state.get(key):
+                validators[key] = state[key]
 
     try:
         html = run_with_retries(
             "leaderboard fetch",
-            lambda: fetch_html(args.url, args.timeout),
+            lambda: fetch_html(args.url, args.timeout, validators),
             retries=args.retries,
             retry_backoff_seconds=args.retry_backoff_seconds,
         )
@@ -567,9 +694,34 @@ def run_single_check(args: argparse.Namespace) -> int:
         print(f"Failed to fetch leaderboard page: {exc}", file=sys.stderr)
         return 1
 
-    normalized = normalize_html_for_hash(html)
-    new_hash = compute_hash(normalized)
-    current_snapshot = parse_leaderboard_snapshot(html) if is_leaderboard_url(args.url) else None
+    # One check time for both the message and last_checked_utc.
+    checked_at = datetime.now(timezone.utc)
+
+    if html is None:
+        print(f"No {page_subject(args.url)} change detected (HTTP 304 Not Modified).")
+        state.pop("pending_hash", None)
+        state.pop("pending_snapshot", None)
+        state.pop("pending_count", None)
+        state["last_checked_utc"] = checked_at.isoformat()
+        save_state(args.state_file, state)
+        return 0
+
+    # A byte-identical body (servers without validators) reuses the previous
+    # check's fingerprint and snapshot instead of re-normalizing the page.
+    raw_hash = compute_hash(html)
+    cached_page = _page_cache.get(args.url)
+    if cached_page is not None and cached_page[0] == raw_hash:
+        _, new_hash, current_snapshot = cached_page
+    else:
+        normalized = normalize_html_for_hash(html)
+        new_hash = compute_hash(normalized)
+        if new_hash == state.get("hash") and isinstance(state.get("snapshot"), list):
+            # Same fingerprint as the stored one: the current snapshot is only
+            # consumed on the hash-changed path, so reuse the stored rows.
+            current_snapshot = state["snapshot"]
+        else:
+            current_snapshot = parse_leaderboard_snapshot(html) if is_leaderboard_url(args.url) else None
+        _page_cache[args.url] = (raw_hash, new_hash, current_snapshot)
 
     # --- Structured parsing (runs alongside hash detection) ---
     structured_snapshot = None
@@ -590,7 +742,6 @@ def run_single_check(args: argparse.Namespace) -> int:
             print(f"Warning: structured parsing modules not available: {exc}", file=sys.stderr)
             use_structured = False
 
-    state = load_state(args.state_file)
     old_hash = state.get("hash")
     old_snapshot = state.get("snapshot")
     if not isinstance(old_snapshot, list):
@@ -703,7 +854,7 @@ def run_single_check(args: argparse.Namespace) -> int:
 
     if should_send:
         if args.force_send and not changed:
-            message = build_force_send_no_change_message(args.url, new_hash)
+            message = build_force_send_no_change_message(args.url, new_hash, checked_at=checked_at)
         else:
             # Use rich structured diff message if available
             if use_structured and structured_diff and has_changes(structured_diff):
@@ -733,6 +884,7 @@ def run_single_check(args: argparse.Namespace) -> int:
                     previous_snapshot=effective_old_snapshot,
                     current_snapshot=current_snapshot,
                     use_legacy_hash_message=use_legacy_hash_message,
+                    checked_at=checked_at,
                 )
         if args.dry_run:
             print("[dry-run] Would send Discord message:")
@@ -768,8 +920,11 @@ def run_single_check(args: argparse.Namespace) -> int:
     state_updates = {
         "url": args.url,
         "snapshot_top_n": DEFAULT_SNAPSHOT_TOP_N,
-        "last_checked_utc": datetime.now(timezone.utc).isoformat(),
+        "last_checked_utc": checked_at.isoformat(),
     }
+    state.pop("etag", None)
+    state.pop("last_modified", None)
+    state_updates.update(validators)
     # Update the stored hash whenever the confirmation threshold is reached
     # (even if the structured veto suppressed the notification), so the next
     # check doesn't restart the confirmation cycle for the same hash.
@@ -789,6 +944,12 @@ def run_single_check(args: argparse.Namespace) -> int:
     return 0
 
 
+def _confirmation_pending(state_file: Path) -> bool:
+    state = load_state(state_file)
+    pending_hash = state.get("pending_hash")
+    return bool(pending_hash) and pending_hash != state.get("hash")
+
+
 def main() -> int:
     args = parse_args()
 
@@ -811,6 +972,9 @@ def main() -> int:
     if args.min_interval_seconds > args.max_interval_seconds:
         print("Error: --min-interval-seconds cannot be greater than --max-interval-seconds", file=sys.stderr)
         return 2
+    if args.confirmation_delay_seconds is not None and args.confirmation_delay_seconds < 0:
+        print("Error: --confirmation-delay-seconds must be non-negative", file=sys.stderr)
+        return 2
     if args.max_checks is not None and args.max_checks <= 0:
         print("Error: --max-checks must be greater than 0", file=sys.stderr)
         return 2
@@ -844,8 +1008,13 @@ def main() -> int:
                     file=sys.stderr,
                 )
                 return 1
-            backoff = min(60 * consecutive_errors, 300)
-            print(f"Check failed (attempt {consecutive_errors}/{max_consecutive_errors}); retrying in {backoff}s.")
+            # Double the wait per consecutive failure (with jitter) so a long
+            # outage is polled less and less often.
+            backoff = min(60 * 2 ** (consecutive_errors - 1), 900) + random.uniform(0, 30)
+            print(
+                f"Check failed (attempt {consecutive_errors}/{max_consecutive_errors}); "
+                f"retrying in {backoff:.0f}s."
+            )
             time.sleep(backoff)
             continue
         else:
@@ -855,8 +1024,12 @@ def main() -> int:
             print(f"Reached max checks ({args.max_checks}); stopping loop.")
             return 0
 
-        sleep_seconds = random.randint(args.min_interval_seconds, args.max_interval_seconds)
-        print(f"Sleeping {sleep_seconds} seconds before next check.")
+        if args.confirmation_delay_seconds is not None and _confirmation_pending(args.state_file):
+            sleep_seconds = args.confirmation_delay_seconds
+            print(f"Confirming new fingerprint in {sleep_seconds} seconds.")
+        else:
+            sleep_seconds = random.randint(args.min_interval_seconds, args.max_interval_seconds)
+            print(f"Sleeping {sleep_seconds} seconds before next check.")
         time.sleep(sleep_seconds)
 
 
@@ -32,7 +32,8 @@ def parse_rank_spread(raw: str, model_rank: int) -> tuple[int, int] | None:
         return None
 
     n = len(digits)
-    candidates: list[tuple[int, int, float]] = []
+    best: tuple[int, int] | None = None
+    best_score = 0
 
     for split_pos in range(1, n):
         left = digits[:split_pos]
@@ -68,35 +69,40 @@ def parse_rank_spread(raw: str, model_rank: int) -> tuple[int, int] | None:
         # on a CI of width 18 (score = 20 + 18 = 38) still beats an exact
         # fit on width 633 (score = 0 + 633 = 633).
         score = overshoot * 20 + width
-        candidates.append((ub, lb, score))
+        # Strict "<" keeps the earliest split on ties.
+        if best is None or score < best_score:
+            best = (ub, lb)
+            best_score = score
 
-    if not candidates:
-        return None
-
-    candidates.sort(key=lambda c: c[2])
-    return (candidates[0][0], candidates[0][1])
+    return best
 
 
 # ---------------------------------------------------------------------------
 # HTML helpers
 # ---------------------------------------------------------------------------
 
+_TAG_RE = re.compile(r"<[^>]+>")
+_HREF_RE = re.compile(r'<a\b[^>]*\bhref=["\']([^"\']+)["\']', re.I)
+_LINK_TEXT_RE = re.compile(r"<a\b[^>]*>(.*?)</a>", re.I | re.S)
+
+
 def _strip_tags(html_fragment: str) -> str:
     """Remove HTML tags and decode entities."""
-    text = re.sub(r"<[^>]+>", " ", html_fragment)
+    text = _TAG_RE.sub(" ", html_fragment) if "<" in html_fragment else html_fragment
     text = unescape(text)
-    return re.sub(r"\s+", " ", text).strip()
+    # str.split() splits on the same whitespace as \s+, and drops the ends.
+    return " ".join(text.split())
 
 
 def _extract_href(cell_html: str) -> str | None:
     """Return the first href value from an anchor tag, if any."""
-    m = re.search(r'<a\b[^>]*\bhref=["\']([^"\']+)["\']', cell_html, flags=re.I)
+    m = _HREF_RE.search(cell_html)
     return m.group(1) if m else None
 
 
 def _extract_link_text(cell_html: str) -> str | None:
     """Return the text content of the first <a> tag."""
-    m = re.search(r"<a\b[^>]*>(.*?)</a>", cell_html, flags=re.I | re.S)
+    m = _LINK_TEXT_RE.search(cell_html)
     return _strip_tags(m.group(1)) if m else None
 
 
@@ -104,25 +110,27 @@ def _extract_link_text(cell_html: str) -> str | None:
 # Page‑level metadata
 # ---------------------------------------------------------------------------
 
+_DATE_RE = re.compile(r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+\d{4}")
+_VOTES_META_RE = re.compile(r"([\d,]+)\s+votes", re.I)
+_MODELS_META_RE = re.compile(r"(\d+)\s+models", re.I)
+
+
 def parse_page_metadata(html: str) -> dict:
     """Extract page‑level information (date stamp, total votes, total models)."""
     meta: dict = {}
 
     # Date stamp — e.g. "Feb 11, 2026"
-    date_match = re.search(
-        r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{1,2},?\s+\d{4}",
-        html,
-    )
+    date_match = _DATE_RE.search(html)
     if date_match:
         meta["leaderboard_date"] = date_match.group(0)
 
     # Total votes — e.g. "5,271,984 votes"
-    votes_match = re.search(r"([\d,]+)\s+votes", html, flags=re.I)
+    votes_match = _VOTES_META_RE.search(html)
     if votes_match:
         meta["total_votes"] = int(votes_match.group(1).replace(",", ""))
 
     # Total models — e.g. "305 models"
-    models_match = re.search(r"(\d+)\s+models", html, flags=re.I)
+    models_match = _MODELS_META_RE.search(html)
     if models_match:
         meta["total_models"] = int(models_match.group(1))
 
@@ -158,21 +166,30 @@ def _detect_columns(header_cells: list[str]) -> dict[str, int]:
 # Row parsing
 # ---------------------------------------------------------------------------
 
+_PRELIM_RE = re.compile(r"preliminary", re.I)
+_SCORE_CI_RE = re.compile(r"(-?\d[\d,]*)\s*[±\+\-/]\s*(\d[\d,]*)")
+_BARE_NUM_RE = re.compile(r"(-?\d[\d,]+)")
+_ORG_SPLIT_RE = re.compile(r"\s*[·|/]\s*")
+_LICENSE_HINT_RE = re.compile(r"(?i)^(?:proprietary|open|apache|mit|cc|gpl|bsd)")
+_DIGIT_RE = re.compile(r"(\d+)")
+_LETTER_RE = re.compile(r"[a-zA-Z]")
+
+
 def _parse_score_ci(text: str) -> tuple[int | None, int | None, bool]:
     """Parse a score±CI cell, returning (score, ci, is_preliminary)."""
-    is_preliminary = bool(re.search(r"preliminary", text, re.I))
+    is_preliminary = bool(_PRELIM_RE.search(text))
     # Remove "Preliminary" text for numeric parsing
-    cleaned = re.sub(r"preliminary", "", text, flags=re.I).strip()
+    cleaned = _PRELIM_RE.sub("", text).strip()
 
     # Try "score±ci" or "score ± ci"
-    m = re.search(r"(-?\d[\d,]*)\s*[±\+\-/]\s*(\d[\d,]*)", cleaned)
+    m = _SCORE_CI_RE.search(cleaned)
     if m:
         score = int(m.group(1).replace(",", ""))
         ci = int(m.group(2).replace(",", ""))
         return score, ci, is_preliminary
 
     # Just a bare number
-    m = re.search(r"(-?\d[\d,]+)", cleaned)
+    m = _BARE_NUM_RE.search(cleaned)
     if m:
         score = int(m.group(1).replace(",", ""))
         return score, None, is_preliminary
@@ -205,7 +222,7 @@ def _parse_model_cell(cell_html: str) -> dict:
     # Try to parse organization and license from remainder
     # Common patterns: "Anthropic · Proprietary", "OpenAI Proprietary", etc.
     if remainder:
-        parts = re.split(r"\s*[·|/]\s*", remainder)
+        parts = _ORG_SPLIT_RE.split(remainder)
         parts = [p.strip() for p in parts if p.strip()]
         if len(parts) >= 2:
             result["organization"] = parts[0]
@@ -213,7 +230,7 @@ def _parse_model_cell(cell_html: str) -> dict:
         elif len(parts) == 1:
             # Heuristic: if it looks like a license, treat it as one
             text = parts[0]
-            if re.search(r"(?i)^(?:proprietary|open|apache|mit|cc|gpl|bsd)", text):
+            if _LICENSE_HINT_RE.search(text):
                 result["license"] = text
             else:
                 result["organization"] = text
@@ -224,7 +241,7 @@ def _parse_model_cell(cell_html: str) -> dict:
 def _parse_votes(text: str) -> int | None:
     """Parse a vote count that may contain commas."""
     cleaned = text.replace(",", "").strip()
-    m = re.search(r"(\d+)", cleaned)
+    m = _DIGIT_RE.search(cleaned)
     if m:
         return int(m.group(1))
     return None
@@ -234,13 +251,54 @@ def _parse_votes(text: str) -> int | None:
 # Full table parsing
 # ---------------------------------------------------------------------------
 
+_TABLE_RE = re.compile(r"<table\b[^>]*>(.*?)</table>", re.I | re.S)
+_TR_RE = re.compile(r"<tr\b[^>]*>(.*?)</tr>", re.I | re.S)
+_CELL_RE = re.compile(r"<t[hd]\b[^>]*>(.*?)</t[hd]>", re.I | re.S)
+_RANK_ONLY_RE = re.compile(r"^(\d+)$")
+
+
+def _element_contents(html: str, name: str, pattern: re.Pattern) -> list[str]:
+    """Return the inner HTML of every ``<name …>…</name>`` element in *html*.
+
+    Same result as ``pattern.findall(html)`` for the matching ``_TABLE_RE``
+    or ``_TR_RE`` pattern, but the tag boundaries are located with
+    ``str.find`` on a lowercased copy instead of a lazy ``.*?`` match, which
+    is faster over a whole page or table.  Short row fragments are cheaper
+    to split with ``_CELL_RE`` directly.
+    """
+    lowered = html.lower()
+    if len(lowered) != len(html):
+        # "İ" lowercases to two characters, so offsets would not line up.
+        return pattern.findall(html)
+
+    opener = "<" + name
+    closer = "</" + name + ">"
+    contents: list[str] = []
+    start = lowered.find(opener)
+    while start != -1:
+        name_end = start + len(opener)
+        # Require a word boundary after the name, like ``\b`` in the pattern.
+        if name_end < len(html) and (html[name_end].isalnum() or html[name_end] == "_"):
+            start = lowered.find(opener, name_end)
+            continue
+        tag_end = lowered.find(">", name_end)
+        if tag_end == -1:
+            break
+        close = lowered.find(closer, tag_end + 1)
+        if close == -1:
+            break
+        contents.append(html[tag_end + 1:close])
+        start = lowered.find(opener, close + len(closer))
+    return contents
+
+
 def parse_leaderboard_table(html: str) -> list[dict]:
     """Parse the leaderboard HTML into a list of structured model dicts.
 
     Returns all models found, sorted by rank.
     """
     # Find all tables that look like leaderboard tables
-    tables = re.findall(r"<table\b[^>]*>(.*?)</table>", html, flags=re.I | re.S)
+    tables = _element_contents(html, "table", _TABLE_RE)
     if not tables:
         # Fall back to parsing the whole page as if it were one big table
         tables = [html]
@@ -248,19 +306,19 @@ def parse_leaderboard_table(html: str) -> list[dict]:
     best_result: list[dict] = []
 
     for table_html in tables:
-        rows = re.findall(r"<tr\b[^>]*>(.*?)</tr>", table_html, flags=re.I | re.S)
+        rows = _element_contents(table_html, "tr", _TR_RE)
         if not rows:
             continue
 
         # Detect columns from header row
-        header_cells = re.findall(r"<t[hd]\b[^>]*>(.*?)</t[hd]>", rows[0], flags=re.I | re.S)
+        header_cells = _CELL_RE.findall(rows[0])
         col_map = _detect_columns(header_cells)
 
         # Must have at least rank and model columns
         if "rank" not in col_map and "model" not in col_map:
             # Try to detect from any row containing "rank" and "model" text
             for row in rows[:3]:
-                cells = re.findall(r"<t[hd]\b[^>]*>(.*?)</t[hd]>", row, flags=re.I | re.S)
+                cells = _CELL_RE.findall(row)
                 col_map = _detect_columns(cells)
                 if "rank" in col_map and "model" in col_map:
                     break
@@ -269,7 +327,7 @@ def parse_leaderboard_table(html: str) -> list[dict]:
 
         parsed_rows: list[dict] = []
         for row_html in rows[1:]:  # Skip header
-            cells_raw = re.findall(r"<t[hd]\b[^>]*>(.*?)</t[hd]>", row_html, flags=re.I | re.S)
+            cells_raw = _CELL_RE.findall(row_html)
             if len(cells_raw) < 2:
                 continue
 
@@ -279,7 +337,7 @@ def parse_leaderboard_table(html: str) -> list[dict]:
             rank_idx = col_map.get("rank", 0)
             if rank_idx < len(cells_raw):
                 rank_text = _strip_tags(cells_raw[rank_idx])
-                m = re.search(r"(\d+)", rank_text)
+                m = _DIGIT_RE.search(rank_text)
                 if m:
                     entry["rank"] = int(m.group(1))
                 else:
@@ -308,7 +366,7 @@ def parse_leaderboard_table(html: str) -> list[dict]:
                 if not model_data.get("model_name"):
                     continue
                 # Filter out numeric-only model names (not real models)
-                if not re.search(r"[a-zA-Z]", model_data["model_name"]):
+                if not _LETTER_RE.search(model_data["model_name"]):
                     continue
                 entry.update(model_data)
             else:
@@ -352,17 +410,17 @@ def _fallback_parse(html: str) -> list[dict]:
     Looks for rows with a leading integer (rank) followed by text (model name)
     and a numeric score.
     """
-    rows = re.findall(r"<tr\b[^>]*>(.*?)</tr>", html, flags=re.I | re.S)
+    rows = _element_contents(html, "tr", _TR_RE)
     results: list[dict] = []
     for row_html in rows:
-        cells_raw = re.findall(r"<t[hd]\b[^>]*>(.*?)</t[hd]>", row_html, flags=re.I | re.S)
+        cells_raw = _CELL_RE.findall(row_html)
         cells = [_strip_tags(c) for c in cells_raw]
         cells = [c for c in cells if c]
         if len(cells) < 2:
             continue
 
         # First cell should be a rank
-        m = re.match(r"^(\d+)$", cells[0].strip())
+        m = _RANK_ONLY_RE.match(cells[0].strip())
         if not m:
             continue
         rank = int(m.group(1))
@@ -371,7 +429,7 @@ def _fallback_parse(html: str) -> list[dict]:
 
         # Second cell should be a model name (contains letters)
         model_name = cells[1]
-        if not re.search(r"[a-zA-Z]", model_name):
+        if not _LETTER_RE.search(model_name):
             continue
 
         entry: dict = {"rank": rank, "model_name": model_name}
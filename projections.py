@@ -23,6 +23,7 @@ from pathlib import Path
 from typing import Optional
 
 from overtake_probability import compute_overtake_probability
+from snapshot_store import parse_ts
 
 WEEKLY = "weekly"
 MONTHLY = "monthly"
@@ -197,15 +198,6 @@ def time_to_resolution(
 # Bulk vote rate computation (single pass over timeseries)
 # ---------------------------------------------------------------------------
 
-def _parse_ts(ts_str: Optional[str]) -> Optional[datetime]:
-    if not ts_str:
-        return None
-    try:
-        return datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
-    except (ValueError, AttributeError):
-        return None
-
-
 def bulk_vote_rates(
     timeseries: list[dict],
     model_names: set[str],
@@ -226,7 +218,7 @@ def bulk_vote_rates(
     latest: dict[str, tuple[datetime, int]] = {}
 
     for record in timeseries:
-        ts = _parse_ts(record.get("ts"))
+        ts = parse_ts(record.get("ts"))
         if ts is None or ts < cutoff:
             continue
         for m in record.get("models", []):
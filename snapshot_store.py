@@ -3,13 +3,15 @@
 
 from __future__ import annotations
 
+import functools
 import gzip
 import json
 import os
 import sys
+import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 
 DEFAULT_SNAPSHOT_DIR = "data/snapshots"
@@ -17,6 +19,45 @@ DEFAULT_TIMESERIES_DIR = "data/timeseries"
 DEFAULT_TOP_N = 20
 
 
+# ---------------------------------------------------------------------------
+# Atomic file writes
+# ---------------------------------------------------------------------------
+
+def _target_mode(path: Path) -> int:
+    """Permission bits for *path*: its current mode, or the umask default."""
+    try:
+        return path.stat().st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_text_atomic(path: str | Path, content: str) -> None:
+    """Replace *path* with *content* without ever exposing a partial file.
+
+    The text goes to a synced temp file in the same directory, which is then
+    renamed over *path*.  The temp file gets the existing file's mode (or
+    the umask default for a new file) first, since ``mkstemp`` creates it
+    owner-only.
+    """
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_name, _target_mode(path))
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
 # ---------------------------------------------------------------------------
 # Snapshot storage (full JSON files)
 # ---------------------------------------------------------------------------
@@ -191,30 +232,152 @@ def append_top_n(
         if proj_compact:
             record["projections"] = proj_compact
 
-    line = json.dumps(record, ensure_ascii=False) + "\n"
+    line = json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
     with open(filepath, "a", encoding="utf-8") as f:
         f.write(line)
 
     return filepath
 
 
+# Parsed time series keyed by file path -> (_TimeseriesCacheEntry).
+# The monitor loop and batch queries reload the same file many times per
+# process; re-parsing is skipped until the file changes on disk, and when
+# it has only grown (append_top_n) just the appended lines are parsed.
+_TAIL_CHECK_BYTES = 64
+
+
+class _TimeseriesCacheEntry:
+    __slots__ = ("mtime_ns", "size", "tail", "records")
+
+    def __init__(self, mtime_ns: int, size: int, tail: bytes, records: list[dict]):
+        self.mtime_ns = mtime_ns
+        self.size = size
+        self.tail = tail  # last bytes of the file at ``size``, to detect rewrites
+        self.records = records
+
+
+_timeseries_cache: dict[str, _TimeseriesCacheEntry] = {}
+
+
 def load_timeseries(
     timeseries_dir: str | Path = DEFAULT_TIMESERIES_DIR,
 ) -> list[dict]:
-    """Load all records from the top-N JSONL time series file."""
+    """Load all records from the top-N JSONL time series file.
+
+    Returns a fresh list on every call (callers may append to it), but the
+    record dicts themselves are shared with the in-process cache and should
+    be treated as read-only.
+    """
     filepath = Path(timeseries_dir) / "top20.jsonl"
-    if not filepath.exists():
+    try:
+        st = filepath.stat()
+    except OSError:
         return []
+    key = str(filepath)
+    cached = _timeseries_cache.get(key)
+    if cached is not None and cached.mtime_ns == st.st_mtime_ns and cached.size == st.st_size:
+        return list(cached.records)
+
+    with open(filepath, "rb") as f:
+        if cached is not None and 0 < cached.size < st.st_size:
+            # Appended since the last load?  The bytes that used to end the
+            # file must be unchanged and end on a line boundary.
+            f.seek(max(cached.size - len(cached.tail), 0))
+            if f.read(len(cached.tail)) == cached.tail and cached.tail.endswith(b"\n"):
+                new_records, tail = _read_records(f, cached.size, st.st_size, cached.tail)
+                records = cached.records + new_records
+                _timeseries_cache[key] = _TimeseriesCacheEntry(
+                    st.st_mtime_ns, st.st_size, tail, records,
+                )
+                return list(records)
+            f.seek(0)
+        records, tail = _read_records(f, 0, st.st_size, b"")
+    _timeseries_cache[key] = _TimeseriesCacheEntry(st.st_mtime_ns, st.st_size, tail, records)
+    return list(records)
+
+
+def _read_records(f: BinaryIO, offset: int, limit: int, tail: bytes) -> tuple[list[dict], bytes]:
+    """Parse lines from ``f`` (positioned at ``offset``) up to byte ``limit``.
+
+    Reading stops at the size seen by ``stat`` so a concurrent append is
+    picked up by the next load rather than half-read now.  Returns the
+    records and the last ``_TAIL_CHECK_BYTES`` bytes consumed.
+    """
     records = []
-    for line in filepath.read_text(encoding="utf-8").splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            records.append(json.loads(line))
-        except json.JSONDecodeError:
+    for line in f:
+        if offset >= limit:
+            break
+        if offset + len(line) > limit:
+            line = line[:limit - offset]
+        offset += len(line)
+        tail = (tail + line)[-_TAIL_CHECK_BYTES:]
+        record = _parse_line(line)
+        if record is not None:
+            records.append(record)
+    return records, tail
+
+
+def _parse_line(line: bytes) -> dict | None:
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        record = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    if not isinstance(record, dict):
+        return None
+    _intern_strings(record)
+    return record
+
+
+def _intern_strings(record: dict) -> None:
+    """Intern the timestamp and model names of a time series record, in place.
+
+    The same few dozen names repeat in every record; interning shares one
+    string object per name so set/dict lookups in the query loops usually
+    short-circuit on identity instead of comparing characters.  Interned
+    timestamps do the same for the ``parse_ts`` cache.
+    """
+    ts = record.get("ts")
+    if type(ts) is str:
+        record["ts"] = sys.intern(ts)
+    for field in ("models", "overtake_top5", "h2h_top5"):
+        entries = record.get(field)
+        if not isinstance(entries, list):
             continue
-    return records
+        for entry in entries:
+            if isinstance(entry, dict):
+                name = entry.get("name")
+                if type(name) is str:
+                    entry["name"] = sys.intern(name)
+
+
+def parse_ts(ts_str: object) -> datetime | None:
+    """Parse a record's ISO 8601 ``ts`` value, or return None if it is not one."""
+    # Checked before the cache so malformed records with unhashable values
+    # are skipped rather than raising TypeError from lru_cache.
+    if not isinstance(ts_str, str):
+        return None
+    return _parse_ts_cached(ts_str)
+
+
+@functools.lru_cache(maxsize=100_000)
+def _parse_ts_cached(ts_str: str) -> datetime | None:
+    # Every query re-walks the same records, so each distinct timestamp
+    # string is only parsed once per process.  Bounded so a long-running
+    # monitor process cannot grow it without limit.
+    if not ts_str:
+        return None
+    try:
+        # Python 3.11+ accepts the trailing "Z" directly.
+        return datetime.fromisoformat(ts_str)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+    except ValueError:
+        return None
 
 
 # ---------------------------------------------------------------------------
@@ -232,8 +395,8 @@ def save_latest_for_cache(
     """
     cache_path = Path(cache_path)
     cache_path.parent.mkdir(parents=True, exist_ok=True)
-    content = json.dumps(snapshot, indent=2, ensure_ascii=False) + "\n"
-    cache_path.write_text(content, encoding="utf-8")
+    # Written atomically so an interrupted run leaves the previous cache intact.
+    write_text_atomic(cache_path, json.dumps(snapshot, indent=2, ensure_ascii=False) + "\n")
 
 
 def load_from_cache(cache_path: str | Path) -> dict | None:
@@ -0,0 +1,190 @@
+"""Tests for the analytics query helpers."""
+
+import json
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from analytics import (
+    _window_start,
+    ci_threshold_date,
+    days_at_top,
+    rank_ub_changes,
+    score_trajectory,
+    vote_accumulation_rate,
+)
+
+
+def _ts(hours_ago):
+    dt = datetime.now(timezone.utc) - timedelta(hours=hours_ago)
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _write_timeseries(ts_dir, records):
+    lines = "".join(json.dumps(r) + "\n" for r in records)
+    (Path(ts_dir) / "top20.jsonl").write_text(lines, encoding="utf-8")
+
+
+class TestRankUbChanges(unittest.TestCase):
+    def test_reports_first_and_last_rank_ub(self):
+        records = [
+            {"ts": _ts(48), "models": [
+                {"rank": 1, "name": "Alpha", "rank_ub": 1},
+                {"rank": 2, "name": "Beta", "rank_ub": 3},
+            ]},
+            {"ts": _ts(24), "models": [
+                {"rank": 1, "name": "Alpha", "rank_ub": 1},
+                {"rank": 2, "name": "Beta", "rank_ub": 2},
+            ]},
+            {"ts": _ts(1), "models": [
+                {"rank": 1, "name": "Beta", "rank_ub": 1},
+                {"rank": 2, "name": "Alpha", "rank_ub": 1},
+            ]},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_timeseries(tmpdir, records)
+            changes = rank_ub_changes(days=7, timeseries_dir=tmpdir)
+        self.assertEqual(changes, [
+            {"model": "Beta", "first_rank_ub": 3, "last_rank_ub": 1, "delta": -2},
+        ])
+
+    def test_ignores_records_outside_window(self):
+        records = [
+            {"ts": _ts(24 * 30), "models": [{"rank": 1, "name": "Alpha", "rank_ub": 5}]},
+            {"ts": _ts(1), "models": [{"rank": 1, "name": "Alpha", "rank_ub": 1}]},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_timeseries(tmpdir, records)
+            self.assertEqual(rank_ub_changes(days=7, timeseries_dir=tmpdir), [])
+
+
+class TestWindowStart(unittest.TestCase):
+    def test_bisects_to_first_record_in_window(self):
+        records = [{"ts": _ts(h)} for h in (24 * 30, 24 * 10, 48, 24, 1)]
+        cutoff = datetime.now(timezone.utc) - timedelta(days=7)
+        self.assertEqual(_window_start(records, cutoff), 2)
+
+    def test_all_records_before_cutoff(self):
+        records = [{"ts": _ts(24 * 30)}, {"ts": _ts(24 * 20)}]
+        cutoff = datetime.now(timezone.utc) - timedelta(days=7)
+        self.assertEqual(_window_start(records, cutoff), 2)
+
+
+class TestCiThresholdDate(unittest.TestCase):
+    def test_returns_first_record_below_threshold(self):
+        records = [
+            {"ts": "2026-02-15T12:00:00Z", "models": [{"name": "Alpha", "ci": 9}]},
+            {"ts": "2026-02-16T12:00:00Z", "models": [
+                {"name": "Beta", "ci": 2},
+                {"name": "Alpha", "ci": 4},
+            ]},
+            {"ts": "2026-02-17T12:00:00Z", "models": [{"name": "Alpha", "ci": 3}]},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_timeseries(tmpdir, records)
+            result = ci_threshold_date("Alpha", threshold=5, timeseries_dir=tmpdir)
+        self.assertEqual(result, "2026-02-16T12:00:00Z")
+
+    def test_never_below_threshold(self):
+        records = [{"ts": "2026-02-15T12:00:00Z", "models": [{"name": "Alpha", "ci": 9}]}]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_timeseries(tmpdir, records)
+            self.assertIsNone(ci_threshold_date("Alpha", threshold=5, timeseries_dir=tmpdir))
+
+
+class TestVoteAccumulationRate(unittest.TestCase):
+    def test_rate_over_window(self):
+        records = [
+            {"ts": _ts(24 * 30), "models": [{"name": "Alpha", "votes": 100}]},
+            {"ts": _ts(48), "models": [{"name": "Alpha", "votes": 1000}]},
+            {"ts": _ts(24), "models": [{"name": "Beta", "votes": 50}, {"name": "Alpha", "votes": 1500}]},
+            {"ts": _ts(0), "models": [{"name": "Alpha", "votes": 2000}]},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_timeseries(tmpdir, records)
+            result = vote_accumulation_rate("Alpha", days=7, timeseries_dir=tmpdir)
+        self.assertEqual(result["start_votes"], 1000)
+        self.assertEqual(result["end_votes"], 2000)
+        self.assertEqual(result["delta"], 1000)
+        self.assertAlmostEqual(result["votes_per_day"], 500.0, delta=1.0)
+
+    def test_now_override_moves_window(self):
+        records = [
+            {"ts": "2026-01-01T00:00:00Z", "models": [{"name": "Alpha", "votes": 100}]},
+            {"ts": "2026-01-03T00:00:00Z", "models": [{"name": "Alpha", "votes": 300}]},
+        ]
+        now = datetime(2026, 1, 4, tzinfo=timezone.utc)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_timeseries(tmpdir, records)
+            result = vote_accumulation_rate("Alpha", days=7, timeseries_dir=tmpdir, now=now)
+        self.assertEqual(result["votes_per_day"], 100.0)
+
+    def test_skips_records_with_non_string_ts(self):
+        records = [
+            {"ts": ["2026-01-01T00:00:00Z"], "models": [{"name": "Alpha", "votes": 0}]},
+            {"ts": {"at": 1}, "models": [{"name": "Alpha", "votes": 0}]},
+            {"ts": "2026-01-01T00:00:00Z", "models": [{"name": "Alpha", "votes": 100}]},
+            {"ts": "2026-01-03T00:00:00Z", "models": [{"name": "Alpha", "votes": 300}]},
+        ]
+        now = datetime(2026, 1, 4, tzinfo=timezone.utc)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_timeseries(tmpdir, records)
+            result = vote_accumulation_rate("Alpha", days=7, timeseries_dir=tmpdir, now=now)
+        self.assertEqual(result["start_votes"], 100)
+        self.assertEqual(result["votes_per_day"], 100.0)
+
+    def test_insufficient_data(self):
+        records = [{"ts": _ts(1), "models": [{"name": "Alpha", "votes": 100}]}]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_timeseries(tmpdir, records)
+            self.assertIsNone(vote_accumulation_rate("Alpha", timeseries_dir=tmpdir))
+
+
+class TestScoreTrajectory(unittest.TestCase):
+    def test_defaults_to_top_n_of_latest_record(self):
+        records = [
+            {"ts": _ts(24), "models": [
+                {"rank": 1, "name": "Alpha", "score": 1500, "ci": 8},
+                {"rank": 2, "name": "Beta", "score": 1490},
+                {"rank": 3, "name": "Gamma", "score": 1480},
+            ]},
+            {"ts": _ts(1), "models": [
+                {"rank": 1, "name": "Beta", "score": 1505},
+                {"rank": 2, "name": "Alpha", "score": 1502, "ci": 7},
+                {"rank": 3, "name": "Gamma", "score": 1481},
+            ]},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_timeseries(tmpdir, records)
+            result = score_trajectory(top_n=2, days=7, timeseries_dir=tmpdir)
+        self.assertEqual(list(result), ["Beta", "Alpha"])
+        self.assertEqual([p["score"] for p in result["Beta"]], [1490, 1505])
+        self.assertEqual(result["Alpha"][0], {"ts": records[0]["ts"], "score": 1500, "rank": 1, "ci": 8})
+        self.assertEqual(result["Alpha"][1]["rank"], 2)
+
+
+class TestDaysAtTop(unittest.TestCase):
+    def test_counts_only_current_run(self):
+        records = [
+            {"ts": _ts(24 * 10), "models": [{"name": "Alpha"}, {"name": "Beta"}]},
+            {"ts": _ts(24 * 5), "models": [{"name": "Beta"}, {"name": "Alpha"}]},
+            {"ts": _ts(48), "models": [{"name": "Alpha"}, {"name": "Beta"}]},
+            {"ts": _ts(1), "models": [{"name": "Alpha"}, {"name": "Beta"}]},
+        ]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_timeseries(tmpdir, records)
+            result = days_at_top(timeseries_dir=tmpdir)
+        self.assertEqual(result["model"], "Alpha")
+        self.assertEqual(result["first_seen_at_top"], records[2]["ts"])
+        self.assertAlmostEqual(result["days"], 2.0, delta=0.1)
+
+    def test_no_models_in_latest_record(self):
+        records = [{"ts": _ts(1), "models": []}]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_timeseries(tmpdir, records)
+            self.assertIsNone(days_at_top(timeseries_dir=tmpdir))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,178 @@
+"""Tests for conditional (ETag / Last-Modified) leaderboard fetches."""
+
+import argparse
+import json
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from unittest import mock
+
+import leaderboard_notifier
+from leaderboard_notifier import fetch_html, run_single_check
+
+PAGE = b"<html><body><h1>Leaderboard</h1><p>Rank Model Score</p></body></html>"
+ETAG = '"v1"'
+LAST_MODIFIED = "Wed, 18 Feb 2026 12:00:00 GMT"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    requests_seen: list = []
+
+    def do_GET(self):
+        type(self).requests_seen.append(self.headers)
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", ETAG)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.send_header("Content-Length", str(len(PAGE)))
+        self.end_headers()
+        self.wfile.write(PAGE)
+
+    def log_message(self, *args):
+        pass
+
+
+class ConditionalFetchTests(unittest.TestCase):
+    def setUp(self):
+        _Handler.requests_seen = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/leaderboard"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_records_validators_from_full_response(self):
+        validators = {}
+        html = fetch_html(self.url, 5, validators)
+        self.assertIn("Leaderboard", html)
+        self.assertEqual(validators, {"etag": ETAG, "last_modified": LAST_MODIFIED})
+        self.assertNotIn("If-None-Match", _Handler.requests_seen[0])
+
+    def test_returns_none_when_not_modified(self):
+        validators = {"etag": ETAG, "last_modified": LAST_MODIFIED}
+        self.assertIsNone(fetch_html(self.url, 5, validators))
+        self.assertEqual(_Handler.requests_seen[0]["If-None-Match"], ETAG)
+        self.assertEqual(_Handler.requests_seen[0]["If-Modified-Since"], LAST_MODIFIED)
+
+    def _make_args(self, state_file):
+        return argparse.Namespace(
+            url=self.url,
+            webhook_url="",
+            state_file=state_file,
+            timeout=5,
+            retries=0,
+            retry_backoff_seconds=0,
+            confirmation_checks=2,
+            force_send=False,
+            dry_run=True,
+            no_structured=True,
+        )
+
+    def test_unchanged_check_skips_hashing(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / "state.json"
+            args = self._make_args(state_file)
+            with mock.patch("dashboard.generate_dashboard"):
+                self.assertEqual(run_single_check(args), 0)
+            first_state = json.loads(state_file.read_text(encoding="utf-8"))
+            self.assertEqual(first_state["etag"], ETAG)
+
+            with mock.patch.object(
+                leaderboard_notifier, "normalize_html_for_hash", side_effect=AssertionError("hashed"),
+            ):
+                self.assertEqual(run_single_check(args), 0)
+            second_state = json.loads(state_file.read_text(encoding="utf-8"))
+
+        self.assertEqual(_Handler.requests_seen[1]["If-None-Match"], ETAG)
+        self.assertEqual(second_state["hash"], first_state["hash"])
+        self.assertEqual(second_state["etag"], ETAG)
+
+    def test_pending_confirmation_fetches_full_page(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / "state.json"
+            state_file.write_text(json.dumps({
+                "url": self.url,
+                "hash": "old",
+                "pending_hash": "new",
+                "pending_count": 1,
+                "etag": ETAG,
+            }), encoding="utf-8")
+            with mock.patch("dashboard.generate_dashboard"):
+                self.assertEqual(run_single_check(self._make_args(state_file)), 0)
+
+        self.assertNotIn("If-None-Match", _Handler.requests_seen[0])
+
+
+class UnchangedBodyTests(unittest.TestCase):
+    def test_identical_body_is_not_renormalized(self):
+        url = "https://example.com/leaderboard/text"
+        args = argparse.Namespace(
+            url=url,
+            webhook_url="",
+            timeout=5,
+            retries=0,
+            retry_backoff_seconds=0,
+            confirmation_checks=2,
+            force_send=False,
+            dry_run=True,
+            no_structured=True,
+        )
+        normalize = mock.Mock(wraps=leaderboard_notifier.normalize_html_for_hash)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            args.state_file = Path(tmpdir) / "state.json"
+            with mock.patch.object(leaderboard_notifier, "fetch_html", return_value=PAGE.decode()), \
+                    mock.patch.object(leaderboard_notifier, "normalize_html_for_hash", normalize), \
+                    mock.patch("dashboard.generate_dashboard"):
+                self.assertEqual(run_single_check(args), 0)
+                first_hash = json.loads(args.state_file.read_text(encoding="utf-8"))["hash"]
+                self.assertEqual(run_single_check(args), 0)
+                state = json.loads(args.state_file.read_text(encoding="utf-8"))
+
+        self.assertEqual(normalize.call_count, 1)
+        self.assertEqual(state["hash"], first_hash)
+        self.assertNotIn("pending_hash", state)
+
+    def test_stored_snapshot_reused_for_unchanged_fingerprint(self):
+        url = "https://example.com/leaderboard/other"
+        html = PAGE.decode()
+        stored_snapshot = [{"rank": 1, "model": "Alpha"}]
+        args = argparse.Namespace(
+            url=url,
+            webhook_url="",
+            timeout=5,
+            retries=0,
+            retry_backoff_seconds=0,
+            confirmation_checks=2,
+            force_send=False,
+            dry_run=True,
+            no_structured=True,
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            args.state_file = Path(tmpdir) / "state.json"
+            args.state_file.write_text(json.dumps({
+                "url": url,
+                "hash": leaderboard_notifier.compute_hash(leaderboard_notifier.normalize_html_for_hash(html)),
+                "snapshot": stored_snapshot,
+            }), encoding="utf-8")
+            with mock.patch.object(leaderboard_notifier, "fetch_html", return_value=html), \
+                    mock.patch.object(
+                        leaderboard_notifier, "parse_leaderboard_snapshot", side_effect=AssertionError("parsed"),
+                    ), \
+                    mock.patch("dashboard.generate_dashboard"):
+                self.assertEqual(run_single_check(args), 0)
+            state = json.loads(args.state_file.read_text(encoding="utf-8"))
+
+        self.assertEqual(state["snapshot"], stored_snapshot)
+
+
+if __name__ == "__main__":
+    unittest.main()
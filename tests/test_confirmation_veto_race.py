@@ -179,5 +179,70 @@ class TestConfirmationVetoRace(unittest.TestCase):
             self.assertTrue(structured_diff["leaderboard_date_changed"])
 
 
+class TestConfirmationDelay(unittest.TestCase):
+    """A pending fingerprint is re-checked after the short confirmation delay."""
+
+    def _run_loop(self, state):
+        from unittest import mock
+        import leaderboard_notifier
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            state_file = Path(tmpdir) / "state.json"
+            state_file.write_text(json.dumps(state), encoding="utf-8")
+            args = argparse.Namespace(
+                webhook_url=None,
+                dry_run=True,
+                retries=0,
+                retry_backoff_seconds=1,
+                confirmation_checks=2,
+                loop=True,
+                min_interval_seconds=120,
+                max_interval_seconds=300,
+                max_checks=2,
+                confirmation_delay_seconds=15,
+                state_file=state_file,
+            )
+            with mock.patch.object(leaderboard_notifier, "parse_args", return_value=args), \
+                    mock.patch.object(leaderboard_notifier, "run_single_check", return_value=0), \
+                    mock.patch.object(leaderboard_notifier.time, "sleep") as sleep:
+                self.assertEqual(leaderboard_notifier.main(), 0)
+        return [call.args[0] for call in sleep.call_args_list]
+
+    def test_short_sleep_while_confirmation_pending(self):
+        sleeps = self._run_loop({"hash": "aaa", "pending_hash": "bbb", "pending_count": 1})
+        self.assertEqual(sleeps, [15])
+
+    def test_regular_interval_when_nothing_pending(self):
+        sleeps = self._run_loop({"hash": "aaa", "pending_hash": "aaa", "pending_count": 1})
+        self.assertEqual(len(sleeps), 1)
+        self.assertGreaterEqual(sleeps[0], 120)
+
+    def test_failed_checks_back_off_exponentially(self):
+        from unittest import mock
+        import leaderboard_notifier
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            args = argparse.Namespace(
+                webhook_url=None,
+                dry_run=True,
+                retries=0,
+                retry_backoff_seconds=1,
+                confirmation_checks=2,
+                loop=True,
+                min_interval_seconds=120,
+                max_interval_seconds=300,
+                max_checks=None,
+                confirmation_delay_seconds=None,
+                state_file=Path(tmpdir) / "state.json",
+            )
+            with mock.patch.object(leaderboard_notifier, "parse_args", return_value=args), \
+                    mock.patch.object(leaderboard_notifier, "run_single_check", return_value=1), \
+                    mock.patch.object(leaderboard_notifier.random, "uniform", return_value=0), \
+                    mock.patch.object(leaderboard_notifier.time, "sleep") as sleep:
+                self.assertEqual(leaderboard_notifier.main(), 1)
+        sleeps = [call.args[0] for call in sleep.call_args_list]
+        self.assertEqual(sleeps, [60, 120, 240, 480, 900, 900, 900, 900, 900])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,21 @@
 """Tests for the dashboard generator."""
 
+import base64
+import gzip
 import json
+import random
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
-from dashboard import extract_chart_data, generate_dashboard
+import dashboard
+from dashboard import (
+    _downsample_chart_data,
+    _lttb_indices,
+    extract_chart_data,
+    generate_dashboard,
+)
 
 
 def _make_record(ts, models, overtake=None, h2h=None, leader_prob=None):
@@ -123,8 +133,11 @@ class TestExtractChartData(unittest.TestCase):
             ),
         ]
         data = extract_chart_data(records)
-        self.assertEqual(data["overtake"]["Beta"], [0.35])
+        self.assertEqual(data["overtake"]["Beta"], [35.0])
         self.assertEqual(data["leader_prob"], [0.65])
+        # No H2H data: nothing shipped for the H2H chart.
+        self.assertEqual(data["h2h"], {})
+        self.assertEqual(data["series"]["h2h"], [])
 
     def test_h2h_data(self):
         records = [
@@ -138,7 +151,7 @@ class TestExtractChartData(unittest.TestCase):
             ),
         ]
         data = extract_chart_data(records)
-        self.assertEqual(data["h2h"]["Beta"], [0.48])
+        self.assertEqual(data["h2h"]["Beta"], [48.0])
 
     def test_contender_absent_in_earlier_record(self):
         """Score gap is None when contender is absent from a snapshot."""
@@ -156,6 +169,33 @@ class TestExtractChartData(unittest.TestCase):
         self.assertIsNone(data["score_gap"]["Beta"][0])
         self.assertEqual(data["score_gap"]["Beta"][1], 10)
 
+    def test_late_contender_keeps_earlier_history(self):
+        """A model that only becomes a contender later still gets its full series."""
+        records = [
+            _make_record("2026-02-18T12:00:00Z", [
+                {"rank": 1, "name": "Alpha", "score": 1500, "ci": 8, "votes": 5000},
+                {"rank": 2, "name": "Beta", "score": 1470, "ci": 10, "votes": 4000},
+            ]),
+            _make_record(
+                "2026-02-18T16:00:00Z",
+                [
+                    {"rank": 1, "name": "Alpha", "score": 1500, "ci": 8, "votes": 5100},
+                    {"rank": 2, "name": "Beta", "score": 1495, "ci": 9, "votes": 4300},
+                ],
+                overtake=[{"name": "Beta", "prob": 0.3, "gap": 5}],
+                h2h=[{"name": "Gamma", "wr": 0.4, "gap": 30}],
+            ),
+        ]
+        data = extract_chart_data(records)
+        self.assertEqual(data["contenders"], ["Beta", "Gamma"])
+        self.assertEqual(data["score_gap"]["Beta"], [30, 5])
+        self.assertEqual(data["votes"]["Beta"], [4000, 4300])
+        self.assertEqual(data["overtake"]["Beta"], [None, 30.0])
+        # Gamma only appears in H2H data, never in the model list.
+        self.assertEqual(data["score_gap"]["Gamma"], [None, None])
+        self.assertEqual(data["h2h"]["Gamma"], [None, 40.0])
+        self.assertEqual(data["series"], {"overtake": ["Beta"], "h2h": ["Gamma"]})
+
     def test_contenders_ordered_by_rank(self):
         records = [
             _make_record(
@@ -176,6 +216,91 @@ class TestExtractChartData(unittest.TestCase):
         self.assertEqual(data["contenders"], ["Beta", "Epsilon"])
 
 
+class TestDownsampling(unittest.TestCase):
+    def test_lttb_keeps_endpoints_and_peak(self):
+        values = [0.0] * 1000
+        values[437] = 50.0
+        idx = _lttb_indices(values, 20)
+        self.assertEqual(len(idx), 20)
+        self.assertEqual(idx[0], 0)
+        self.assertEqual(idx[-1], 999)
+        self.assertIn(437, idx)
+
+    def test_lttb_skips_nulls_and_short_series(self):
+        self.assertEqual(_lttb_indices([None, 1, None, 2], 10), [1, 3])
+
+    def test_downsample_slices_every_series_consistently(self):
+        records = [
+            _make_record(
+                f"2026-02-18T{i // 60:02d}:{i % 60:02d}:00Z",
+                [
+                    {"rank": 1, "name": "Alpha", "score": 1500 + i % 7, "ci": 8, "votes": 5000 + i},
+                    {"rank": 2, "name": "Beta", "score": 1490, "ci": 10, "votes": 4000 + i},
+                ],
+                overtake=[{"name": "Beta", "prob": 0.2, "gap": 10}],
+            )
+            for i in range(300)
+        ]
+        data = _downsample_chart_data(extract_chart_data(records), 50)
+        n = len(data["timestamps"])
+        self.assertLess(n, 300)
+        self.assertEqual(data["timestamps"][0], records[0]["ts"])
+        self.assertEqual(data["timestamps"][-1], records[-1]["ts"])
+        for key in ("score_gap", "overtake", "h2h", "votes", "ci"):
+            for name, values in data[key].items():
+                points = data["points"][key][name]
+                self.assertEqual(len(values), len(points))
+                self.assertEqual(points, sorted(points))
+                self.assertTrue(all(0 <= p < n for p in points))
+        self.assertEqual(len(data["leader_prob"]), n)
+
+    def test_each_series_keeps_its_own_spike_within_cap(self):
+        rng = random.Random(7)
+        names = [f"Model{k}" for k in range(20)]
+        spikes = {name: 100 + 240 * k for k, name in enumerate(names)}
+        records = [
+            _make_record(
+                f"2026-02-{1 + i // 1440:02d}T{i // 60 % 24:02d}:{i % 60:02d}:00Z",
+                [
+                    {
+                        "rank": r + 1, "name": name, "score": 1500 - 5 * r + rng.randint(-2, 2),
+                        "ci": rng.randint(4, 12),
+                        "votes": 4000 + rng.randint(0, 50) + (10_000 if spikes[name] == i else 0),
+                    }
+                    for r, name in enumerate(names)
+                ],
+            )
+            for i in range(5000)
+        ]
+        data = _downsample_chart_data(extract_chart_data(records), 100)
+        charted = list(data["votes"])
+        self.assertGreaterEqual(len(charted), 3)
+        for name in charted:
+            values = data["votes"][name]
+            self.assertLessEqual(len(values), 100)
+            peak = max(values)
+            self.assertGreater(peak, 10_000)
+            ts = data["timestamps"][data["points"]["votes"][name][values.index(peak)]]
+            self.assertEqual(ts, records[spikes[name]]["ts"])
+
+    def test_gaps_survive_downsampling(self):
+        records = []
+        for i in range(1000):
+            models = [{"rank": 1, "name": "Alpha", "score": 1500 + i % 5, "ci": 8, "votes": 5000 + i}]
+            if not 400 <= i < 600:
+                models.append({"rank": 2, "name": "Beta", "score": 1490, "ci": 10, "votes": 4000 + i})
+            records.append(_make_record(f"2026-02-18T{i // 60 % 24:02d}:{i % 60:02d}:00Z", models))
+        data = _downsample_chart_data(extract_chart_data(records), 50)
+        self.assertIn(None, data["votes"]["Beta"])
+        self.assertLessEqual(len(data["votes"]["Beta"]), 50)
+
+    def test_short_history_untouched(self):
+        data = extract_chart_data([_make_record("2026-02-18T12:00:00Z", [
+            {"rank": 1, "name": "Alpha", "score": 1500, "ci": 8, "votes": 5000},
+        ])])
+        self.assertIs(_downsample_chart_data(data, 50), data)
+
+
 class TestGenerateDashboard(unittest.TestCase):
     def test_generates_html_file(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -198,6 +323,90 @@ class TestGenerateDashboard(unittest.TestCase):
             self.assertIn("Kalshi Settlement Dashboard", content)
             self.assertIn("Plotly", content)
             self.assertIn("Alpha", content)
+            self.assertIn('<script src="test_data.js"></script>', content)
+
+            data_js = (Path(tmpdir) / "test_data.js").read_text()
+            self.assertTrue(data_js.startswith("const DATA = "))
+            data = json.loads(data_js[len("const DATA = "):].rstrip().rstrip(";"))
+            self.assertEqual(data["leader"], "Alpha")
+
+    def test_compressed_chart_data(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ts_dir = Path(tmpdir) / "timeseries"
+            ts_dir.mkdir()
+            record = _make_record("2026-02-18T12:00:00Z", [
+                {"rank": 1, "name": "Alpha", "score": 1500, "ci": 8, "votes": 5000},
+                {"rank": 2, "name": "Beta", "score": 1490, "ci": 10, "votes": 4000},
+            ])
+            (ts_dir / "top20.jsonl").write_text(json.dumps(record) + "\n")
+
+            output = Path(tmpdir) / "test.html"
+            generate_dashboard(timeseries_dir=ts_dir, output_path=output, compress_data=True)
+            data_js = (Path(tmpdir) / "test_data.js").read_text()
+            self.assertTrue(data_js.startswith('const DATA_GZ = "'))
+            b64 = data_js[len('const DATA_GZ = "'):].rstrip().rstrip(';').rstrip('"')
+            data = json.loads(gzip.decompress(base64.b64decode(b64)))
+            self.assertEqual(data["leader"], "Alpha")
+
+    def test_skips_regeneration_when_timeseries_unchanged(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ts_dir = Path(tmpdir) / "timeseries"
+            ts_dir.mkdir()
+            ts_file = ts_dir / "top20.jsonl"
+            record = _make_record("2026-02-18T12:00:00Z", [
+                {"rank": 1, "name": "Alpha", "score": 1500, "ci": 8, "votes": 5000},
+            ])
+            ts_file.write_text(json.dumps(record) + "\n")
+
+            output = Path(tmpdir) / "test.html"
+            generate_dashboard(timeseries_dir=ts_dir, output_path=output)
+            with open(output, "a") as f:
+                f.write("<!-- marker -->")
+            generate_dashboard(timeseries_dir=ts_dir, output_path=output)
+            self.assertIn("<!-- marker -->", output.read_text())
+
+            record["models"][0]["name"] = "Omega"
+            with open(ts_file, "a") as f:
+                f.write(json.dumps(record) + "\n")
+            generate_dashboard(timeseries_dir=ts_dir, output_path=output)
+            content = output.read_text()
+            self.assertNotIn("<!-- marker -->", content)
+            self.assertIn("Omega", content)
+
+    def test_regenerates_when_options_or_version_change(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ts_dir = Path(tmpdir) / "timeseries"
+            ts_dir.mkdir()
+            record = _make_record("2026-02-18T12:00:00Z", [
+                {"rank": 1, "name": "Alpha", "score": 1500, "ci": 8, "votes": 5000},
+            ])
+            (ts_dir / "top20.jsonl").write_text(json.dumps(record) + "\n")
+            output = Path(tmpdir) / "test.html"
+
+            def regenerated(**kwargs):
+                with open(output, "a") as f:
+                    f.write("<!-- marker -->")
+                generate_dashboard(timeseries_dir=ts_dir, output_path=output, **kwargs)
+                return "<!-- marker -->" not in output.read_text()
+
+            generate_dashboard(timeseries_dir=ts_dir, output_path=output)
+            self.assertFalse(regenerated())
+            self.assertTrue(regenerated(max_points=100))
+            self.assertTrue(regenerated(max_points=100, compress_data=True))
+            self.assertFalse(regenerated(max_points=100, compress_data=True))
+            with mock.patch.object(dashboard, "_DASHBOARD_VERSION", dashboard._DASHBOARD_VERSION + 1):
+                self.assertTrue(regenerated(max_points=100, compress_data=True))
+
+    def test_data_script_src_is_url_quoted(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ts_dir = Path(tmpdir) / "timeseries"
+            ts_dir.mkdir()
+            (ts_dir / "top20.jsonl").write_text("")
+
+            output = Path(tmpdir) / "my report#1.html"
+            generate_dashboard(timeseries_dir=ts_dir, output_path=output)
+            self.assertTrue((Path(tmpdir) / "my report#1_data.js").exists())
+            self.assertIn('<script src="my%20report%231_data.js"></script>', output.read_text())
 
     def test_empty_timeseries_still_generates(self):
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -0,0 +1,75 @@
+"""Tests for fetch_html against a local HTTP server."""
+
+import gzip
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib import error
+
+from leaderboard_notifier import fetch_html
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path == "/old":
+            self._reply(301, b"", location="/page")
+        elif self.path == "/broken":
+            self._reply(500, b"boom")
+        elif self.path == "/gzip" and "gzip" in self.headers.get("Accept-Encoding", ""):
+            self._reply(200, gzip.compress(b"<p>compressed</p>"), encoding="gzip")
+        elif self.path == "/corrupt-gzip":
+            self._reply(200, gzip.compress(b"<p>compressed</p>")[:-6], encoding="gzip")
+        else:
+            self._reply(200, b"<p>ok</p>")
+
+    def _reply(self, status, body, location=None, encoding=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        if location:
+            self.send_header("Location", location)
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FetchHtmlTests(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_follows_redirects(self):
+        self.assertEqual(fetch_html(f"{self.base}/old", 5), "<p>ok</p>")
+
+    def test_decodes_gzip_response(self):
+        self.assertEqual(fetch_html(f"{self.base}/gzip", 5), "<p>compressed</p>")
+
+    def test_corrupt_gzip_raises_url_error(self):
+        with self.assertRaises(error.URLError):
+            fetch_html(f"{self.base}/corrupt-gzip", 5)
+
+    def test_error_status_raises_http_error(self):
+        with self.assertRaises(error.HTTPError) as ctx:
+            fetch_html(f"{self.base}/broken", 5)
+        self.assertEqual(ctx.exception.code, 500)
+        self.assertEqual(ctx.exception.read(), b"boom")
+
+    def test_connection_refused_raises_url_error(self):
+        self.server.shutdown()
+        self.server.server_close()
+        with self.assertRaises(error.URLError):
+            fetch_html(f"{self.base}/page", 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -192,6 +192,29 @@ class TestLeaderboardTableParsing(unittest.TestCase):
         models = parse_leaderboard_table(html)
         self.assertEqual(len(models), 0)
 
+    def test_uppercase_tags_and_lookalike_tag_names(self):
+        html = """
+        <TABLE class="lb"><tablet>
+            <TR><TH>Rank</TH><TH>Model</TH><TH>Score</TH></TR>
+            <track src="x"></track>
+            <Tr data-row="1"><td>1</td><td>model-a</td><td>1500</td></tR>
+            <tr><td>2</td><td>model-b</td><td>1490</td></tr>
+        </Table>
+        """
+        models = parse_leaderboard_table(html)
+        self.assertEqual([m["model_name"] for m in models], ["model-a", "model-b"])
+
+    def test_dotted_capital_i_falls_back_to_regex_split(self):
+        html = """
+        <table>
+            <tr><th>Rank</th><th>Model</th><th>Score</th></tr>
+            <tr><td>1</td><td>İnci-model</td><td>1500</td></tr>
+            <tr><td>2</td><td>model-b</td><td>1490</td></tr>
+        </table>
+        """
+        models = parse_leaderboard_table(html)
+        self.assertEqual([m["model_name"] for m in models], ["İnci-model", "model-b"])
+
 
 class TestParseHtml(unittest.TestCase):
     def test_full_parse(self):
@@ -0,0 +1,45 @@
+"""Tests for the page normalization behind the change fingerprint."""
+
+import unittest
+
+import leaderboard_notifier
+from leaderboard_notifier import normalize_html_for_hash
+
+
+class CaseInsensitiveScrubTests(unittest.TestCase):
+    def test_ascii_separator_counts_as_whitespace(self):
+        # \x1c is ASCII but only Unicode \s matches it, so the scrub must
+        # keep Unicode whitespace classes.
+        text = "<p>Last\x1cupdated 2024</p>"
+        self.assertEqual(leaderboard_notifier._RE_TIMESTAMP_LABEL.sub(" ", text), "<p> </p>")
+
+    def test_separator_before_utc_is_scrubbed(self):
+        text = "Checked 2024-01-02 12:30\x1fUTC today"
+        self.assertEqual(leaderboard_notifier._RE_ISO_DATETIME.sub(" ", text), "Checked   today")
+
+    def test_separator_in_anchor_phrase(self):
+        html = "<div>intro</div><h1>Arena\x1dLLM Leaderboard</h1>"
+        self.assertEqual(leaderboard_notifier._anchor_bounds(html)[0], html.index("Arena"))
+
+    def test_long_s_anchor_passes_prefilter(self):
+        # re.I matches "\u017f" against "s" although lower() keeps it.
+        html = "<div>intro</div><th>\u017fcore</th>"
+        start = html.index("\u017f")
+        self.assertEqual(leaderboard_notifier._anchor_bounds(html), (start, start + 5))
+
+    def test_fingerprint_ignores_timestamp_with_separator(self):
+        first = "<h1>Leaderboard</h1><p>Rank Model Score</p><p>Last\x1cupdated 10:00</p>"
+        second = "<h1>Leaderboard</h1><p>Rank Model Score</p><p>Last\x1cupdated 11:00</p>"
+        self.assertEqual(normalize_html_for_hash(first), normalize_html_for_hash(second))
+
+
+class NumericCellTests(unittest.TestCase):
+    def test_parse_rank_and_score(self):
+        self.assertEqual(leaderboard_notifier._parse_rank("#12 (tied)"), 12)
+        self.assertIsNone(leaderboard_notifier._parse_rank("n/a"))
+        self.assertEqual(leaderboard_notifier._parse_score("1,504.5"), 1504.5)
+        self.assertEqual(leaderboard_notifier._parse_score("-3"), -3.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import unittest
+from datetime import datetime, timezone
 
 from leaderboard_notifier import build_message, diff_snapshots, parse_leaderboard_snapshot
 
@@ -96,6 +97,17 @@ class SnapshotParsingTests(unittest.TestCase):
         self.assertIn("Top 1 snapshot changes:", message)
         self.assertIn("dropped from top 1", message)
 
+    def test_message_uses_given_check_time(self):
+        message = build_message(
+            "https://arena.ai/leaderboard/text",
+            "abc123",
+            "def456",
+            previous_snapshot=[{"rank": 1, "model": "GPT-5"}],
+            current_snapshot=[{"rank": 1, "model": "Claude 4"}],
+            checked_at=datetime(2026, 2, 18, 12, 30, 5, tzinfo=timezone.utc),
+        )
+        self.assertIn("Checked at: 2026-02-18 12:30:05 UTC", message)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@
 
 import gzip
 import json
+import sys
 import tempfile
 import unittest
 from pathlib import Path
@@ -126,6 +127,54 @@ class TestTopNTimeSeries(unittest.TestCase):
         with tempfile.TemporaryDirectory() as tmpdir:
             self.assertEqual(load_timeseries(tmpdir), [])
 
+    def test_load_returns_independent_lists(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            append_top_n(_sample_snapshot(), timeseries_dir=tmpdir)
+            first = load_timeseries(tmpdir)
+            first.append({"ts": "synthetic"})
+            self.assertEqual(len(load_timeseries(tmpdir)), 1)
+
+    def test_load_interns_model_names(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            append_top_n(_sample_snapshot(), timeseries_dir=tmpdir)
+            append_top_n(_sample_snapshot(), timeseries_dir=tmpdir)
+            first, second = load_timeseries(tmpdir)
+            self.assertIs(first["models"][0]["name"], second["models"][0]["name"])
+
+    def test_load_interns_timestamps(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            snapshot = _sample_snapshot()
+            snapshot["timestamp"] = "2026-02-15T10:00:00Z"
+            append_top_n(snapshot, timeseries_dir=tmpdir)
+            record = load_timeseries(tmpdir)[0]
+            self.assertIs(record["ts"], sys.intern("2026-02-15T10:00:00Z"))
+
+    def test_load_reuses_parsed_records_after_append(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            append_top_n(_sample_snapshot(), timeseries_dir=tmpdir)
+            first = load_timeseries(tmpdir)
+            append_top_n(_sample_snapshot(), timeseries_dir=tmpdir)
+            second = load_timeseries(tmpdir)
+            self.assertEqual(len(second), 2)
+            self.assertIs(second[0], first[0])
+
+    def test_load_detects_rewritten_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "top20.jsonl"
+            path.write_text('{"ts": "a", "models": []}\n', encoding="utf-8")
+            self.assertEqual([r["ts"] for r in load_timeseries(tmpdir)], ["a"])
+            path.write_text(
+                '{"ts": "b", "models": []}\n{"ts": "c", "models": []}\n', encoding="utf-8",
+            )
+            self.assertEqual([r["ts"] for r in load_timeseries(tmpdir)], ["b", "c"])
+
+    def test_load_sees_appended_records(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            append_top_n(_sample_snapshot(), timeseries_dir=tmpdir)
+            self.assertEqual(len(load_timeseries(tmpdir)), 1)
+            append_top_n(_sample_snapshot(), timeseries_dir=tmpdir)
+            self.assertEqual(len(load_timeseries(tmpdir)), 2)
+
 
 class TestCacheHelpers(unittest.TestCase):
     def test_save_and_load_cache(self):
@@ -196,7 +245,8 @@ class TestSnapshotToTimeseriesRecord(unittest.TestCase):
     def test_record_usable_by_bulk_vote_rates(self):
         """The synthetic record should produce non-zero rates when combined
         with an earlier timeseries row."""
-        from projections import bulk_vote_rates, _parse_ts
+        from projections import bulk_vote_rates
+        from snapshot_store import parse_ts
         snap = _sample_snapshot()
         snap["timestamp"] = "2026-02-20T16:00:00Z"
         record = _snapshot_to_timeseries_record(snap)
@@ -211,7 +261,7 @@ class TestSnapshotToTimeseriesRecord(unittest.TestCase):
         }
         ts = [older, record]
         rates = bulk_vote_rates(ts, {"model-1", "model-2"}, lookback_days=7.0,
-                                now=_parse_ts(snap["timestamp"]))
+                                now=parse_ts(snap["timestamp"]))
         self.assertGreater(rates["model-1"], 0.0)
         self.assertGreater(rates["model-2"], 0.0)
 
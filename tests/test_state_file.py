@@ -0,0 +1,64 @@
+"""Tests for the atomic state and structured-cache writes."""
+
+import json
+import os
+import stat
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from leaderboard_notifier import load_state, save_state
+from snapshot_store import load_from_cache, save_latest_for_cache
+
+
+class AtomicWriteTests(unittest.TestCase):
+    def test_save_state_round_trips_without_temp_files(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "state.json"
+            save_state(path, {"hash": "abc", "pending_count": 1})
+            save_state(path, {"hash": "def"})
+            self.assertEqual(load_state(path), {"hash": "def"})
+            self.assertEqual(os.listdir(tmpdir), ["state.json"])
+
+    def test_failed_state_write_keeps_previous_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "state.json"
+            save_state(path, {"hash": "abc"})
+            with mock.patch("snapshot_store.os.replace", side_effect=OSError("disk full")):
+                with self.assertRaises(OSError):
+                    save_state(path, {"hash": "def"})
+            self.assertEqual(json.loads(path.read_text(encoding="utf-8")), {"hash": "abc"})
+            self.assertEqual(os.listdir(tmpdir), ["state.json"])
+
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits")
+    def test_state_write_preserves_existing_mode(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "state.json"
+            path.write_text("{}", encoding="utf-8")
+            os.chmod(path, 0o644)
+            save_state(path, {"hash": "abc"})
+            self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o644)
+
+    @unittest.skipIf(os.name == "nt", "POSIX permission bits")
+    def test_new_file_gets_umask_default_mode(self):
+        old_umask = os.umask(0o022)
+        try:
+            with tempfile.TemporaryDirectory() as tmpdir:
+                path = Path(tmpdir) / "cache" / "latest.json"
+                save_latest_for_cache({"models": []}, path)
+                self.assertEqual(stat.S_IMODE(path.stat().st_mode), 0o644)
+        finally:
+            os.umask(old_umask)
+
+    def test_cache_write_replaces_previous_snapshot(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "cache" / "latest.json"
+            save_latest_for_cache({"models": [{"model_name": "a"}]}, path)
+            save_latest_for_cache({"models": [{"model_name": "b"}]}, path)
+            self.assertEqual(load_from_cache(path)["models"][0]["model_name"], "b")
+            self.assertEqual(os.listdir(path.parent), ["latest.json"])
+
+
+if __name__ == "__main__":
+    unittest.main()